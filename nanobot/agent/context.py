@@ -1,8 +1,15 @@
 """Context builder for assembling agent prompts."""
 
-import base64
+try:
+    # SIMD-accelerated (SSE4.1/AVX2) drop-in replacement for base64
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 import io
 import mimetypes
+import os
+import re
 from pathlib import Path
 from typing import Any
 
@@ -12,82 +19,35 @@ from nanobot.agent.skills import SkillsLoader
 from nanobot.agent.persona import PersonaManager
 
 
-class ContextBuilder:
-    """
-    Builds the context (system prompt + messages) for the agent.
-    
-    Assembles bootstrap files, memory, skills, and conversation history
-    into a coherent prompt for the LLM.
-    """
-    
-    BOOTSTRAP_FILES = ["AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md"]
-    
-    def __init__(self, workspace: Path):
-        self.workspace = workspace
-        self.memory = MemoryStore(workspace)
-        self.skills = SkillsLoader(workspace)
-        self.persona = PersonaManager(workspace)
-    
-    def build_system_prompt(self, skill_names: list[str] | None = None) -> str:
-        """
-        Build the system prompt from bootstrap files, memory, and skills.
-        
-        Args:
-            skill_names: Optional list of skills to include.
-        
-        Returns:
-            Complete system prompt.
-        """
-        parts = []
-        
-        # Core identity
-        parts.append(self._get_identity())
-        
-        # Persona
-        persona = self.persona.get_persona()
-        if persona:
-            # Use string concatenation to avoid f-string issues with braces in persona
-            parts.append("# Persona & Style\n\n" + persona)
-        
-        # Bootstrap files
-        bootstrap = self._load_bootstrap_files()
-        if bootstrap:
-            parts.append(bootstrap)
-        
-        # Memory context
-        memory = self.memory.get_memory_context()
-        if memory:
-            # Use string concatenation to avoid f-string issues with braces in memory
-            parts.append("# Memory\n\n" + memory)
-        
-        # Skills - progressive loading
-        # 1. Always-loaded skills: include full content
-        always_skills = self.skills.get_always_skills()
-        if always_skills:
-            always_content = self.skills.load_skills_for_context(always_skills)
-            if always_content:
-                # Use string concatenation to avoid f-string issues with braces in skills
-                parts.append("# Active Skills\n\n" + always_content)
-        
-        # 2. Available skills: only show summary (agent uses read_file to load)
-        skills_summary = self.skills.build_skills_summary()
-        if skills_summary:
-            parts.append(f"""# Skills
+try:
+    # Imported once here instead of on every compression call
+    from PIL import Image
+except ImportError:
+    Image = None
 
-The following skills extend your capabilities. To use a skill, read its SKILL.md file using the read_file tool.
-Skills with available="false" need dependencies installed first - you can try installing them with apt/brew.
+try:
+    # libjpeg-turbo SIMD encoder; optional, falls back to Pillow's encoder
+    from turbojpeg import TJPF_RGB, TurboJPEG
+    _turbojpeg = TurboJPEG()
+except Exception:  # ImportError, or the native library missing at runtime
+    _turbojpeg = None
 
-{skills_summary}""")
-        
-        return "\n\n---\n\n".join(parts)
-    
-    def _get_identity(self) -> str:
-        """Get the core identity section."""
-        from datetime import datetime
-        now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
-        workspace_path = str(self.workspace.expanduser().resolve())
-        
-        return f"""# nanobot 🐈
+# Keywords (Cyrillic + Latin) that signal the user wants attached media analyzed.
+# Compiled once into a single alternation so matching is one C-level scan
+# instead of a Python loop over substring checks.
+_ANALYZE_KEYWORDS = (
+    "картинк", "изображен", "фото", "что на", "опиши", "покажи",
+    "analyze", "image", "picture", "describe", "look at", "see",
+    "gif", "гифк", "видео", "video",
+)
+_ANALYZE_MEDIA_RE = re.compile(
+    "|".join(map(re.escape, _ANALYZE_KEYWORDS)),
+    re.IGNORECASE,
+)
+
+# Core identity section. Rendered once per build with the workspace path;
+# literal braces in the examples are doubled for str.format.
+IDENTITY_TEMPLATE = """# nanobot 🐈
 
 You are nanobot, a helpful AI assistant. You have access to tools that allow you to:
 - Read, write, and edit files
@@ -96,9 +56,6 @@ You are nanobot, a helpful AI assistant. You have access to tools that allow you
 - Send messages to users on chat channels
 - Spawn subagents for complex background tasks
 
-## Current Time
-{now}
-
 ## Workspace
 Your workspace is at: {workspace_path}
 - Memory files: {workspace_path}/memory/MEMORY.md
@@ -210,18 +167,224 @@ Your workspace is at: {workspace_path}
 
     Always be helpful, accurate, and concise. When using tools, explain what you're doing.
     When remembering something, write to {workspace_path}/memory/MEMORY.md"""
+
+
+class ContextBuilder:
+    """
+    Builds the context (system prompt + messages) for the agent.
+    
+    Assembles bootstrap files, memory, skills, and conversation history
+    into a coherent prompt for the LLM.
+    """
+    
+    BOOTSTRAP_FILES = ("AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md")
+    
+    # Max number of rendered prompts kept in the per-instance cache
+    PROMPT_CACHE_SIZE = 32
+    # Max number of compressed images kept per instance (a few tens of KB each)
+    IMAGE_CACHE_SIZE = 8
+
+    # Safety bounds on history passed to build_messages. Sessions already trim
+    # (see Session.get_history); this guards callers that pass raw lists.
+    HISTORY_MAX_MESSAGES = 30
+    HISTORY_MAX_CHARS = 18000
+
+    # Decoded bootstrap sections keyed by path -> (mtime_ns, size, section text).
+    # Class-level on purpose: the agent loop and every subagent build their own
+    # ContextBuilder over the same workspace, so share one cache process-wide.
+    _file_cache: dict[Path, tuple[int, int, str]] = {}
+
+    def __init__(self, workspace: Path):
+        self.workspace = workspace
+        # Resolved once: expanduser/resolve hit the filesystem on every call
+        self._workspace_path = str(workspace.expanduser().resolve())
+        self.memory = MemoryStore(workspace)
+        self.skills = SkillsLoader(workspace)
+        self.persona = PersonaManager(workspace)
+        # Rendered system prompts keyed by input fingerprint (see _prompt_fingerprint)
+        self._prompt_cache: dict[tuple, str] = {}
+        # Rendered persona/memory sections keyed by name -> (invalidation token, text)
+        self._section_cache: dict[str, tuple[Any, str]] = {}
+        # Compressed images keyed by (path, mtime_ns, size) -> (jpeg bytes, mime)
+        self._image_cache: dict[tuple[str, int, int], tuple[bytes, str]] = {}
+
+    def _stat_fingerprint(self, path: Path) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+        try:
+            st = path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _cached_section(self, name: str, token: Any, render) -> str:
+        """
+        Return a rendered section, re-running `render` only when `token`
+        (typically a file stat fingerprint) has changed since the last call.
+        """
+        cached = self._section_cache.get(name)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        value = render()
+        self._section_cache[name] = (token, value)
+        return value
+
+    def _prompt_fingerprint(self, skill_names: list[str] | None) -> tuple:
+        """
+        Build a cache key for the rendered system prompt.
+
+        Captures everything the prompt depends on: bootstrap file mtimes/sizes,
+        memory (long-term and daily notes) and persona file mtimes, the
+        skills directories, and requested skills. The current time is
+        appended outside the cached body, so it is deliberately not part
+        of the key.
+        """
+        file_keys = tuple(
+            self._stat_fingerprint(self.workspace / f) for f in self.BOOTSTRAP_FILES
+        )
+        return (
+            file_keys,
+            self._stat_fingerprint(self.memory.memory_file),
+            self._stat_fingerprint(self.memory.get_today_file()),
+            self._stat_fingerprint(self.persona.persona_file),
+            self._skills_token(),
+            tuple(skill_names or ()),
+        )
+
+    def build_system_prompt(self, skill_names: list[str] | None = None) -> str:
+        """
+        Build the system prompt from bootstrap files, memory, and skills.
+
+        The assembled prompt body is cached by input fingerprint so repeat
+        calls with unchanged files skip all disk reads. The volatile current
+        time is appended after the cached body, keeping the long prefix
+        byte-stable for provider prompt caching.
+
+        Args:
+            skill_names: Optional list of skills to include.
+
+        Returns:
+            Complete system prompt.
+        """
+        fingerprint = self._prompt_fingerprint(skill_names)
+        cached = self._prompt_cache.get(fingerprint)
+        if cached is not None:
+            return cached + self._current_time_section()
+
+        # Persona
+        persona = self._cached_section(
+            "persona",
+            self._stat_fingerprint(self.persona.persona_file),
+            self.persona.get_persona,
+        )
+
+        # Memory context
+        memory = self._cached_section(
+            "memory",
+            (
+                self._stat_fingerprint(self.memory.memory_file),
+                self._stat_fingerprint(self.memory.get_today_file()),
+            ),
+            self.memory.get_memory_context,
+        )
+
+        # Skills - progressive loading, re-rendered only when a SKILL.md
+        # appears, disappears or changes:
+        # 1. Always-loaded skills: include full content
+        skills_token = self._skills_token()
+        always_content = self._cached_section(
+            "always_skills", skills_token, self._render_always_skills
+        )
+
+        # 2. Available skills: only show summary (agent uses read_file to load)
+        skills_summary = self._cached_section(
+            "skills_summary", skills_token, self.skills.build_skills_summary
+        )
+
+        # Assemble every section up front and join once; empty sections are
+        # filtered in the same pass, avoiding the append-and-regrow churn.
+        # String concatenation avoids f-string issues with braces in content.
+        sections = (
+            self._get_identity(),
+            ("# Persona & Style\n\n" + persona) if persona else "",
+            self._load_bootstrap_files(),
+            ("# Memory\n\n" + memory) if memory else "",
+            ("# Active Skills\n\n" + always_content) if always_content else "",
+            (
+                "# Skills\n\n"
+                "The following skills extend your capabilities. To use a skill, read its SKILL.md file using the read_file tool.\n"
+                "Skills with available=\"false\" need dependencies installed first - you can try installing them with apt/brew.\n\n"
+                + skills_summary
+            ) if skills_summary else "",
+        )
+
+        prompt = "\n\n---\n\n".join(s for s in sections if s)
+
+        # FIFO-evict so the cache stays bounded
+        if len(self._prompt_cache) >= self.PROMPT_CACHE_SIZE:
+            self._prompt_cache.pop(next(iter(self._prompt_cache)))
+        self._prompt_cache[fingerprint] = prompt
+
+        return prompt + self._current_time_section()
+
+    def _render_always_skills(self) -> str:
+        """Render the full content of skills marked always=true."""
+        always_skills = self.skills.get_always_skills()
+        return self.skills.load_skills_for_context(always_skills) if always_skills else ""
+
+    def _skills_token(self) -> tuple:
+        """
+        Change-detection token for the skills directories: the set of skill
+        names plus each SKILL.md stat fingerprint. A few stat calls instead
+        of re-reading and re-parsing every skill per prompt build.
+        """
+        token = []
+        for root in (self.skills.workspace_skills, self.skills.builtin_skills):
+            if not root or not root.is_dir():
+                token.append(None)
+                continue
+            entries = []
+            with os.scandir(root) as it:
+                for entry in sorted(it, key=lambda e: e.name):
+                    if entry.is_dir():
+                        entries.append(
+                            (entry.name, self._stat_fingerprint(Path(entry.path) / "SKILL.md"))
+                        )
+            token.append(tuple(entries))
+        return tuple(token)
+
+    @staticmethod
+    def _current_time_section() -> str:
+        """Volatile timestamp, kept out of the cached prompt body."""
+        from datetime import datetime
+        now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
+        return f"\n\n---\n\n# Current Time\n{now}"
+    
+    def _get_identity(self) -> str:
+        """Get the core identity section (stable; the current time lives in its own section)."""
+        return IDENTITY_TEMPLATE.format_map({"workspace_path": self._workspace_path})
     
     def _load_bootstrap_files(self) -> str:
-        """Load all bootstrap files from workspace."""
+        """Load all bootstrap files from workspace, reusing cached reads when unchanged."""
         parts = []
-        
+
         for filename in self.BOOTSTRAP_FILES:
             file_path = self.workspace / filename
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
-                # Use string concatenation to avoid f-string issues with braces in content
-                parts.append("## " + filename + "\n\n" + content)
-        
+            try:
+                st = file_path.stat()
+            except FileNotFoundError:
+                continue
+
+            cached = self._file_cache.get(file_path)
+            if cached is not None and (st.st_mtime_ns, st.st_size) == (cached[0], cached[1]):
+                parts.append(cached[2])
+                continue
+
+            content = file_path.read_text(encoding="utf-8")
+            # Use string concatenation to avoid f-string issues with braces in content
+            section = "## " + filename + "\n\n" + content
+            self._file_cache[file_path] = (st.st_mtime_ns, st.st_size, section)
+            parts.append(section)
+
         return "\n\n".join(parts) if parts else ""
     
     def build_messages(
@@ -243,20 +406,64 @@ Your workspace is at: {workspace_path}
         Returns:
             List of messages including system prompt.
         """
-        messages = []
-
-        # System prompt
         system_prompt = self.build_system_prompt(skill_names)
-        messages.append({"role": "system", "content": system_prompt})
+        user_content = self._build_user_content(current_message, media)
+        history = self._truncate_history(history)
 
-        # History
-        messages.extend(history)
+        # Build the list in one sized allocation (system + history + user)
+        # instead of append/extend growing it element by element.
+        return [
+            {"role": "system", "content": system_prompt},
+            *history,
+            {"role": "user", "content": user_content},
+        ]
 
-        # Current message (with optional image attachments)
-        user_content = self._build_user_content(current_message, media)
-        messages.append({"role": "user", "content": user_content})
+    @classmethod
+    def _truncate_history(cls, history: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Bound history to a sliding window so an oversized caller-provided
+        list can't blow up the prompt (and the LLM bill).
+        """
+        if len(history) > cls.HISTORY_MAX_MESSAGES:
+            history = history[-cls.HISTORY_MAX_MESSAGES:]
 
-        return messages
+        total_chars = sum(
+            len(m["content"]) for m in history if isinstance(m.get("content"), str)
+        )
+        start = 0
+        while total_chars > cls.HISTORY_MAX_CHARS and start < len(history) - 2:
+            content = history[start].get("content")
+            if isinstance(content, str):
+                total_chars -= len(content)
+            start += 1
+        return history[start:] if start else history
+
+    @staticmethod
+    def _encode_data_url(mime: str, raw_bytes: bytes) -> str:
+        """
+        Build a base64 data URL with a single large allocation.
+
+        Concatenating in bytes and decoding once avoids the extra full-size
+        string copy an f-string around an already-decoded payload would make.
+        """
+        return (
+            b"data:" + mime.encode("ascii") + b";base64," + base64.b64encode(raw_bytes)
+        ).decode("ascii")
+
+    @staticmethod
+    def _encode_data_url_from_file(mime: str, path: Path) -> str:
+        """
+        Base64-encode a file into a data URL in chunks, so the raw bytes and
+        the encoded payload of a large audio/video file never coexist in full.
+
+        The chunk size is a multiple of 3, so each block encodes without
+        padding and the pieces concatenate into valid base64.
+        """
+        chunks = [b"data:" + mime.encode("ascii") + b";base64,"]
+        with open(path, "rb") as f:
+            while block := f.read(3 * 1024 * 1024):
+                chunks.append(base64.b64encode(block))
+        return b"".join(chunks).decode("ascii")
 
     @staticmethod
     def _compress_image_bytes(raw_bytes: bytes, mime: str, path: Path) -> tuple[bytes, str]:
@@ -264,18 +471,20 @@ Your workspace is at: {workspace_path}
         Resize/compress image to reduce token usage (target ~20-50KB instead of 1MB+).
         Returns (jpeg_bytes, "image/jpeg").
         """
-        try:
-            from PIL import Image
-        except ImportError:
+        if Image is None:
             logger.warning("Pillow not installed: image will be sent uncompressed (pip install pillow)")
             return raw_bytes, mime
-        
+
         try:
+            max_side = 512
             img = Image.open(io.BytesIO(raw_bytes))
+            if img.format == "JPEG":
+                # DCT scaling: libjpeg decodes straight to a reduced size,
+                # skipping the full-resolution RGB materialization
+                img.draft("RGB", (max_side, max_side))
             if img.mode in ("RGBA", "P"):
                 img = img.convert("RGB")
             w, h = img.size
-            max_side = 512
             if w > max_side or h > max_side:
                 if w >= h:
                     new_w, new_h = max_side, int(h * max_side / w)
@@ -283,9 +492,19 @@ Your workspace is at: {workspace_path}
                     new_w, new_h = int(w * max_side / h), max_side
                 resampler = Image.Resampling.LANCZOS if hasattr(Image, "Resampling") else Image.LANCZOS
                 img = img.resize((new_w, new_h), resampler)
-            buf = io.BytesIO()
-            img.save(buf, format="JPEG", quality=72, optimize=True)
-            out = buf.getvalue()
+            out = None
+            if _turbojpeg is not None:
+                try:
+                    import numpy as np
+                    out = _turbojpeg.encode(
+                        np.asarray(img.convert("RGB")), pixel_format=TJPF_RGB, quality=72
+                    )
+                except Exception as e:
+                    logger.debug(f"turbojpeg encode failed, using Pillow: {e}")
+            if out is None:
+                buf = io.BytesIO()
+                img.save(buf, format="JPEG", quality=72, optimize=True)
+                out = buf.getvalue()
             logger.info(f"Image compressed: {len(raw_bytes)} -> {len(out)} bytes (~{len(out)*4//3} base64 chars)")
             return out, "image/jpeg"
         except Exception as e:
@@ -298,14 +517,8 @@ Your workspace is at: {workspace_path}
             return text
         
         # Only include media if user EXPLICITLY asks to analyze it
-        text_lower = text.lower()
-        analyze_keywords = [
-            "картинк", "изображен", "фото", "что на", "опиши", "покажи", 
-            "analyze", "image", "picture", "describe", "look at", "see",
-            "gif", "гифк", "видео", "video"
-        ]
-        should_analyze = any(kw in text_lower for kw in analyze_keywords)
-        
+        should_analyze = _ANALYZE_MEDIA_RE.search(text) is not None
+
         if not should_analyze:
             # Just mention that media was attached, don't send the actual file
             return text
@@ -313,28 +526,38 @@ Your workspace is at: {workspace_path}
         content_parts = []
         for path in media:
             p = Path(path)
-            if not p.is_file():
-                continue
-                
             mime, _ = mimetypes.guess_type(path)
             if not mime:
                 continue
 
-            raw_bytes = p.read_bytes()
-            
+            # One stat() covers both "does it exist" and the cache key;
+            # missing/unreadable files are skipped like before.
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+
             if mime.startswith("image/"):
-                # Compress image to reduce tokens (max 512px, JPEG 72%)
-                raw_bytes, mime = self._compress_image_bytes(raw_bytes, mime, p)
-                b64 = base64.b64encode(raw_bytes).decode()
+                # Compress image to reduce tokens (max 512px, JPEG 72%).
+                # The same screenshot is often re-attached across turns, so
+                # reuse the compressed bytes while the file is unchanged.
+                cache_key = (str(p), st.st_mtime_ns, st.st_size)
+                cached = self._image_cache.get(cache_key)
+                if cached is None:
+                    cached = self._compress_image_bytes(p.read_bytes(), mime, p)
+                    if len(self._image_cache) >= self.IMAGE_CACHE_SIZE:
+                        self._image_cache.pop(next(iter(self._image_cache)))
+                    self._image_cache[cache_key] = cached
+                img_bytes, img_mime = cached
                 content_parts.append({
-                    "type": "image_url", 
-                    "image_url": {"url": f"data:{mime};base64,{b64}"}
+                    "type": "image_url",
+                    "image_url": {"url": self._encode_data_url(img_mime, img_bytes)}
                 })
             elif mime.startswith("audio/") or mime.startswith("video/"):
                 # Gemini/LiteLLM support for audio/video via inline data
                 content_parts.append({
                     "type": "image_url",
-                    "image_url": {"url": f"data:{mime};base64,{b64}"}
+                    "image_url": {"url": self._encode_data_url_from_file(mime, p)}
                 })
         
         if not content_parts:
@@ -352,16 +575,16 @@ Your workspace is at: {workspace_path}
         result: str
     ) -> list[dict[str, Any]]:
         """
-        Add a tool result to the message list.
-        
+        Append a tool result to the message list in place.
+
         Args:
-            messages: Current message list.
+            messages: Current message list (mutated).
             tool_call_id: ID of the tool call.
             tool_name: Name of the tool.
             result: Tool execution result.
-        
+
         Returns:
-            Updated message list.
+            The same message list, for chaining.
         """
         messages.append({
             "role": "tool",
@@ -378,15 +601,15 @@ Your workspace is at: {workspace_path}
         tool_calls: list[dict[str, Any]] | None = None
     ) -> list[dict[str, Any]]:
         """
-        Add an assistant message to the message list.
-        
+        Append an assistant message to the message list in place.
+
         Args:
-            messages: Current message list.
+            messages: Current message list (mutated).
             content: Message content.
             tool_calls: Optional tool calls.
-        
+
         Returns:
-            Updated message list.
+            The same message list, for chaining.
         """
         msg: dict[str, Any] = {"role": "assistant", "content": content or ""}
         
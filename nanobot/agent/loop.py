@@ -2,6 +2,9 @@
 
 import asyncio
 import json
+import re
+import time
+from string import Template
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +31,77 @@ from nanobot.agent.subagent import SubagentManager
 from nanobot.session.manager import SessionManager
 
 
+# Framing for public channel-post comments, parsed once. Template.substitute
+# avoids both repeated literal concatenation and f-string brace pitfalls with
+# user-controlled content.
+_CHANNEL_POST_TEMPLATE = Template(
+    "SYSTEM: You are commenting on a channel post in '$channel_title'. "
+    "This is a PUBLIC comment visible to all channel subscribers. "
+    "Respond directly to the post as a community member, not as an analyst reporting to someone.\n\n"
+    "POST CONTENT:\n$post_content\n\n"
+    "Write your public comment below (keep it concise and engaging):"
+)
+
+# Compiled once: matching runs on every inbound message
+_YOUTUBE_URL_RE = re.compile(
+    r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/shorts\/|youtube\.com\/embed\/)([^\s&\n?#]+)'
+)
+
+# Phrases that request a voice reply, merged into one alternation so the
+# check is a single scan instead of a Python loop over substring tests
+_VOICE_REQUEST_RE = re.compile(
+    "|".join(map(re.escape, (
+        "ответь голосовым",
+        "ответит голосовым",
+        "ответить голосовым",
+        "отправь голосовым",
+        "голосом ответь",
+        " голосом",  # "расскажи голосом", "напиши голосом"
+        " голосовым",  # "поприветсвуй голосовым", "сделай голосовым"
+        "голосом.",  # "голосом."
+        "голосовым.",  # "голосовым."
+        "send voice",
+        "voice message",
+        "голосовое сообщение",
+    ))),
+    re.IGNORECASE,
+)
+
+
+class _ResponseCache:
+    """
+    Best-effort cache of answers to repeated context-free questions.
+
+    Keys are whitespace/case-normalized message text. Only responses produced
+    without tool calls and without conversation history are cached, so a hit
+    can never replay a stale side effect or leak another chat's context.
+    """
+
+    def __init__(self, ttl: float = 900.0, max_size: int = 128):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[str, tuple[float, str]] = {}
+
+    @staticmethod
+    def key(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        ts, content = entry
+        if time.monotonic() - ts > self.ttl:
+            del self._entries[key]
+            return None
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        if len(self._entries) >= self.max_size:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic(), content)
+
+
 class AgentLoop:
     """
     The agent loop is the core processing engine.
@@ -39,7 +113,10 @@ class AgentLoop:
     4. Executes tool calls
     5. Sends responses back
     """
-    
+
+    # Upper bound on tools running at once (shared with subagent announces)
+    MAX_CONCURRENT_TOOLS = 4
+
     def __init__(
         self,
         bus: MessageBus,
@@ -57,7 +134,8 @@ class AgentLoop:
         self.model = model or provider.get_default_model()
         self.max_iterations = max_iterations
         self.brave_api_key = brave_api_key
-        self.admin_ids = admin_ids or []
+        # Frozen for O(1) membership checks on every admin-gated call
+        self.admin_ids = frozenset(admin_ids or ())
         self.cron_service = cron_service
         
         self.context = ContextBuilder(workspace)
@@ -72,6 +150,9 @@ class AgentLoop:
         )
         
         self._running = False
+        self._stop_event = asyncio.Event()
+        self._response_cache = _ResponseCache()
+        self._tool_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TOOLS)
         self._register_default_tools()
     
     def _register_default_tools(self) -> None:
@@ -90,13 +171,13 @@ class AgentLoop:
         self.tools.register(WebFetchTool())
         self.tools.register(YouTubeSummaryTool())
         
-        # Message tool
-        message_tool = MessageTool(send_callback=self.bus.publish_outbound)
-        self.tools.register(message_tool)
-        
+        # Message tool (typed reference kept for per-message context updates)
+        self._message_tool = MessageTool(send_callback=self.bus.publish_outbound)
+        self.tools.register(self._message_tool)
+
         # Spawn tool (for subagents)
-        spawn_tool = SpawnTool(manager=self.subagents)
-        self.tools.register(spawn_tool)
+        self._spawn_tool = SpawnTool(manager=self.subagents)
+        self.tools.register(self._spawn_tool)
 
         # Ingestion & Memory tools
         self.tools.register(IngestHistoryTool())
@@ -127,20 +208,47 @@ class AgentLoop:
                 workspace=self.workspace,
                 cron_service=self.cron_service
             ))
+
+        # Dispatch tables for per-message context setup, resolved once here
+        # instead of name-list + hasattr probing on every tool call
+        self._user_context_tools = {
+            name: tool
+            for name in ("clear_context", "import_channel_history")
+            if (tool := self.tools.get(name)) is not None
+            and hasattr(tool, "set_user_context")
+        }
+        self._chat_context_tools = {
+            name: tool
+            for name in ("read_channel_history", "import_channel_history", "create_reminder")
+            if (tool := self.tools.get(name)) is not None
+            and hasattr(tool, "set_chat_context")
+        }
     
     async def run(self) -> None:
-        """Run the agent loop, processing messages from the bus."""
+        """
+        Run the agent loop, processing messages from the bus.
+
+        Blocks on the queue until a message arrives or stop() is called;
+        there is no wake-up polling in between.
+        """
         self._running = True
+        self._stop_event.clear()
         logger.info("Agent loop started")
-        
-        while self._running:
-            try:
-                # Wait for next message
-                msg = await asyncio.wait_for(
-                    self.bus.consume_inbound(),
-                    timeout=1.0
+
+        stop_wait = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            while self._running:
+                inbound = asyncio.ensure_future(self.bus.consume_inbound())
+                await asyncio.wait(
+                    {inbound, stop_wait},
+                    return_when=asyncio.FIRST_COMPLETED
                 )
-                
+                if not inbound.done():
+                    # Woken by stop(); abandon the pending queue read
+                    inbound.cancel()
+                    break
+                msg = inbound.result()
+
                 # Process it
                 logger.info(f"Received message from bus: {msg.channel}:{msg.sender_id}")
                 try:
@@ -158,12 +266,13 @@ class AgentLoop:
                         chat_id=msg.chat_id,
                         content=f"Sorry, I encountered an error: {str(e)}"
                     ))
-            except asyncio.TimeoutError:
-                continue
-    
+        finally:
+            stop_wait.cancel()
+
     def stop(self) -> None:
         """Stop the agent loop."""
         self._running = False
+        self._stop_event.set()
         logger.info("Agent loop stopping")
     
     async def _process_message(self, msg: InboundMessage) -> OutboundMessage | None:
@@ -188,14 +297,9 @@ class AgentLoop:
         # Check if this is a channel post - add context for public comment
         if msg.metadata.get("is_channel_post"):
             channel_title = msg.metadata.get("channel_title", "Unknown")
-            original_content = msg.content
-            # Use string concatenation to avoid f-string issues with braces in content
-            msg.content = (
-                "SYSTEM: You are commenting on a channel post in '" + channel_title + "'. "
-                "This is a PUBLIC comment visible to all channel subscribers. "
-                "Respond directly to the post as a community member, not as an analyst reporting to someone.\n\n"
-                "POST CONTENT:\n" + original_content + "\n\n"
-                "Write your public comment below (keep it concise and engaging):"
+            msg.content = _CHANNEL_POST_TEMPLATE.substitute(
+                channel_title=channel_title,
+                post_content=msg.content,
             )
             logger.info(f"Processing CHANNEL POST from {channel_title}")
         
@@ -205,13 +309,8 @@ class AgentLoop:
         session = self.sessions.get_or_create(msg.session_key)
         
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(msg.channel, msg.chat_id)
-        
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(msg.channel, msg.chat_id)
+        self._message_tool.set_context(msg.channel, msg.chat_id)
+        self._spawn_tool.set_context(msg.channel, msg.chat_id)
         
         # Add context about who is messaging (admin vs regular user)
         current_message = msg.content
@@ -222,10 +321,39 @@ class AgentLoop:
                 username = msg.metadata.get("username") or msg.metadata.get("first_name") or "User"
                 current_message = f"[Community member: {username}] " + msg.content
         
+        # Repeat context-free question? Serve the cached answer without an LLM call
+        cacheable = (
+            not session.messages
+            and not msg.media
+            and not msg.metadata.get("is_channel_post")
+        )
+        cache_key = self._response_cache.key(current_message) if cacheable else None
+        if cache_key is not None:
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                logger.info("Response cache hit, skipping LLM call")
+                session.add_message("user", msg.content)
+                session.add_message("assistant", cached_response)
+                self.sessions.save(session)
+                # Same metadata handling as the LLM path below: a repeated
+                # voice request still needs TTS, and an inline repeat still
+                # needs its request ID to route the answer back
+                metadata = {}
+                if _VOICE_REQUEST_RE.search(msg.content) is not None:
+                    metadata["voice"] = True
+                    logger.info("Voice response requested by user")
+                if msg.metadata.get("inline_request_id"):
+                    metadata["inline_request_id"] = msg.metadata["inline_request_id"]
+                return OutboundMessage(
+                    channel=msg.channel,
+                    chat_id=msg.chat_id,
+                    content=cached_response,
+                    reply_to=msg.metadata.get("message_id"),
+                    metadata=metadata,
+                )
+
         # Auto-detect and extract YouTube transcripts BEFORE LLM call
-        import re
-        youtube_pattern = r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/shorts\/|youtube\.com\/embed\/)([^\s&\n?#]+)'
-        youtube_match = re.search(youtube_pattern, msg.content)
+        youtube_match = _YOUTUBE_URL_RE.search(msg.content)
         
         if youtube_match:
             youtube_url = youtube_match.group(0)
@@ -256,7 +384,8 @@ class AgentLoop:
         # Agent loop
         iteration = 0
         final_content = None
-        
+        used_tools = False
+
         while iteration < self.max_iterations:
             iteration += 1
             logger.info(f"Agent loop iteration {iteration}/{self.max_iterations}")
@@ -280,6 +409,7 @@ class AgentLoop:
             
             # Handle tool calls
             if response.has_tool_calls:
+                used_tools = True
                 # Add assistant message with tool calls
                 tool_call_dicts = [
                     {
@@ -292,39 +422,37 @@ class AgentLoop:
                     }
                     for tc in response.tool_calls
                 ]
-                messages = self.context.add_assistant_message(
+                self.context.add_assistant_message(
                     messages, response.content, tool_call_dicts
                 )
                 
-                # Execute tools
+                # Set per-call context, then execute all tool calls concurrently
                 for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments)
-                    logger.info(f"Executing tool: {tool_call.name} with arguments: {args_str}")
-                    
+                    # Lazy formatting: arguments are only JSON-encoded if
+                    # the INFO level is actually emitted
+                    logger.opt(lazy=True).info(
+                        "Executing tool: {name} with arguments: {args}",
+                        name=lambda tc=tool_call: tc.name,
+                        args=lambda tc=tool_call: json.dumps(tc.arguments),
+                    )
+
                     # Set user context for admin-only tools
-                    if tool_call.name in ["clear_context", "import_channel_history"]:
-                        tool = self.tools.get(tool_call.name)
-                        if tool and hasattr(tool, 'set_user_context'):
-                            user_id = str(msg.metadata.get("user_id", "unknown"))
-                            is_admin = msg.metadata.get("is_admin", False)
-                            tool.set_user_context(user_id, is_admin)
-                    
+                    tool = self._user_context_tools.get(tool_call.name)
+                    if tool is not None:
+                        user_id = str(msg.metadata.get("user_id", "unknown"))
+                        is_admin = msg.metadata.get("is_admin", False)
+                        tool.set_user_context(user_id, is_admin)
+
                     # Set chat context for channel history and reminder tools (for chat isolation)
-                    if tool_call.name in ["read_channel_history", "import_channel_history", "create_reminder"]:
-                        tool = self.tools.get(tool_call.name)
-                        if tool and hasattr(tool, 'set_chat_context'):
-                            # Get chat_id from metadata (from Telegram chat ID)
-                            chat_id = msg.metadata.get("chat_id", msg.sender_id)
-                            tool.set_chat_context(str(chat_id))
-                    
-                    try:
-                        result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                        logger.info(f"Tool {tool_call.name} completed successfully.")
-                    except Exception as e:
-                        logger.error(f"Tool {tool_call.name} failed: {e}")
-                        result = f"Error executing tool: {str(e)}"
-                        
-                    messages = self.context.add_tool_result(
+                    tool = self._chat_context_tools.get(tool_call.name)
+                    if tool is not None:
+                        # Get chat_id from metadata (from Telegram chat ID)
+                        chat_id = msg.metadata.get("chat_id", msg.sender_id)
+                        tool.set_chat_context(str(chat_id))
+
+                results = await self._execute_tool_calls(response.tool_calls)
+                for tool_call, result in zip(response.tool_calls, results):
+                    self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
             else:
@@ -335,28 +463,18 @@ class AgentLoop:
         
         if final_content is None:
             final_content = "I've completed processing but have no response to give."
-        
+
+        # Only pure-LLM answers are safe to replay for an identical question
+        if cache_key is not None and not used_tools:
+            self._response_cache.put(cache_key, final_content)
+
         # Save to session
         session.add_message("user", msg.content)
         session.add_message("assistant", final_content)
         self.sessions.save(session)
         
         # Check if user requested voice response
-        user_msg_lower = msg.content.lower()
-        use_voice = any(phrase in user_msg_lower for phrase in [
-            "ответь голосовым",
-            "ответит голосовым",
-            "ответить голосовым",
-            "отправь голосовым",
-            "голосом ответь",
-            " голосом",  # "расскажи голосом", "напиши голосом"
-            " голосовым",  # "поприветсвуй голосовым", "сделай голосовым"
-            "голосом.",  # "голосом."
-            "голосовым.",  # "голосовым."
-            "send voice",
-            "voice message",
-            "голосовое сообщение"
-        ])
+        use_voice = _VOICE_REQUEST_RE.search(msg.content) is not None
         
         metadata = {}
         if use_voice:
@@ -378,6 +496,29 @@ class AgentLoop:
             metadata=metadata
         )
     
+    async def _execute_tool_calls(self, tool_calls) -> list[str]:
+        """
+        Execute every tool call from one LLM response concurrently.
+
+        Calls within a single response are independent of each other, so they
+        run in parallel inside one TaskGroup, capped by a shared semaphore so
+        a burst of calls can't spawn unbounded subprocesses or HTTP requests.
+        Results come back in the original call order.
+        """
+        async def run_one(tool_call) -> str:
+            async with self._tool_semaphore:
+                try:
+                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
+                    logger.info(f"Tool {tool_call.name} completed successfully.")
+                    return result
+                except Exception as e:
+                    logger.error(f"Tool {tool_call.name} failed: {e}")
+                    return f"Error executing tool: {str(e)}"
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_one(tc)) for tc in tool_calls]
+        return [t.result() for t in tasks]
+
     async def _process_system_message(self, msg: InboundMessage) -> OutboundMessage | None:
         """
         Process a system message (e.g., subagent announce).
@@ -402,13 +543,8 @@ class AgentLoop:
         session = self.sessions.get_or_create(session_key)
         
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(origin_channel, origin_chat_id)
-        
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(origin_channel, origin_chat_id)
+        self._message_tool.set_context(origin_channel, origin_chat_id)
+        self._spawn_tool.set_context(origin_channel, origin_chat_id)
         
         # Build messages with the announce content
         messages = self.context.build_messages(
@@ -452,21 +588,22 @@ class AgentLoop:
                     }
                     for tc in response.tool_calls
                 ]
-                messages = self.context.add_assistant_message(
+                self.context.add_assistant_message(
                     messages, response.content, tool_call_dicts
                 )
                 
                 for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments)
-                    logger.info(f"Executing tool: {tool_call.name} with arguments: {args_str}")
-                    try:
-                        result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                        logger.info(f"Tool {tool_call.name} completed successfully.")
-                    except Exception as e:
-                        logger.error(f"Tool {tool_call.name} failed: {e}")
-                        result = f"Error executing tool: {str(e)}"
-                        
-                    messages = self.context.add_tool_result(
+                    # Lazy formatting: arguments are only JSON-encoded if
+                    # the INFO level is actually emitted
+                    logger.opt(lazy=True).info(
+                        "Executing tool: {name} with arguments: {args}",
+                        name=lambda tc=tool_call: tc.name,
+                        args=lambda tc=tool_call: json.dumps(tc.arguments),
+                    )
+
+                results = await self._execute_tool_calls(response.tool_calls)
+                for tool_call, result in zip(response.tool_calls, results):
+                    self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
             else:
@@ -52,6 +52,22 @@ class MemoryStore:
     def write_long_term(self, content: str) -> None:
         """Write to long-term memory (MEMORY.md)."""
         self.memory_file.write_text(content, encoding="utf-8")
+
+    def append_long_term(self, entry: str) -> None:
+        """
+        Append an entry to long-term memory without rewriting the file.
+
+        O(1) in the size of existing memory, unlike a read/concat/write
+        round trip. A blank line separates entries, matching the format
+        write_long_term callers have produced so far.
+        """
+        try:
+            empty = self.memory_file.stat().st_size == 0
+        except FileNotFoundError:
+            empty = True
+
+        with open(self.memory_file, "a", encoding="utf-8") as f:
+            f.write(entry if empty else "\n\n" + entry)
     
     def get_recent_memories(self, days: int = 7) -> str:
         """
@@ -10,13 +10,26 @@ class PersonaManager:
     def __init__(self, workspace: Path):
         self.workspace = workspace
         self.persona_file = workspace / "PERSONA.md"
-        
+        # (mtime_ns, size) of the file backing the cached content
+        self._cache_key: tuple[int, int] | None = None
+        self._cached_content = ""
+
     def get_persona(self) -> str:
-        """Get the current persona content."""
-        if self.persona_file.exists():
-            return self.persona_file.read_text(encoding="utf-8")
-        return ""
-        
+        """Get the current persona content (re-read only when the file changes)."""
+        try:
+            st = self.persona_file.stat()
+        except FileNotFoundError:
+            self._cache_key = None
+            self._cached_content = ""
+            return ""
+
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._cache_key:
+            self._cached_content = self.persona_file.read_text(encoding="utf-8")
+            self._cache_key = key
+        return self._cached_content
+
     def update_persona(self, content: str) -> None:
         """Update the persona content."""
         self.persona_file.write_text(content, encoding="utf-8")
+        self._cache_key = None
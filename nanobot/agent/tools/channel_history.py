@@ -1,6 +1,7 @@
 """Tool for reading channel post history."""
 
 import json
+from collections import deque
 from pathlib import Path
 from loguru import logger
 from nanobot.agent.tools.base import Tool
@@ -37,22 +38,27 @@ class ReadChannelHistoryTool(Tool):
         self.histories_dir = workspace / "channel_histories"
         self.histories_dir.mkdir(exist_ok=True)
         
-        # Current chat context (set by agent loop)
+        # Current chat context (set by agent loop); the history path is
+        # derived once here rather than re-sanitized on every execute
         self._current_chat_id = None
-    
+        self._history_file = self.workspace / "channel_history.jsonl"
+
     def set_chat_context(self, chat_id: str):
         """Set current chat ID for context isolation."""
+        if chat_id == self._current_chat_id:
+            return
         self._current_chat_id = chat_id
-    
+        if not chat_id:
+            # Fallback to default for backward compatibility
+            self._history_file = self.workspace / "channel_history.jsonl"
+        else:
+            # Sanitize chat_id for filename (remove special chars)
+            safe_chat_id = str(chat_id).replace("-", "neg").replace("|", "_")
+            self._history_file = self.histories_dir / f"chat_{safe_chat_id}.jsonl"
+
     def _get_history_file(self) -> Path:
         """Get history file for current chat."""
-        if not self._current_chat_id:
-            # Fallback to default for backward compatibility
-            return self.workspace / "channel_history.jsonl"
-        
-        # Sanitize chat_id for filename (remove special chars)
-        safe_chat_id = str(self._current_chat_id).replace("-", "neg").replace("|", "_")
-        return self.histories_dir / f"chat_{safe_chat_id}.jsonl"
+        return self._history_file
     
     async def execute(self, limit: int = 20, search: str = None) -> str:
         """Read channel post history for current chat."""
@@ -63,33 +69,32 @@ class ReadChannelHistoryTool(Tool):
                 chat_context = f" for this chat" if self._current_chat_id else ""
                 return f"No channel history available yet{chat_context}. History is built as posts are received."
             
-            # Read all posts from JSONL file
-            posts = []
+            # Stream the JSONL file, keeping only the newest `limit` matches
+            # in a bounded ring (the file is append-only, so last is newest).
+            # Total memory stays O(limit) no matter how large the history grows.
+            search_lower = search.lower() if search else None
+            recent_posts: deque = deque(maxlen=max(limit, 1))
+            total = 0
             with open(history_file, 'r', encoding='utf-8') as f:
                 for line in f:
-                    if line.strip():
-                        try:
-                            post = json.loads(line)
-                            posts.append(post)
-                        except json.JSONDecodeError:
-                            continue
-            
-            if not posts:
-                return "No posts found in channel history."
-            
-            # Filter by search term if provided
-            if search:
-                search_lower = search.lower()
-                posts = [p for p in posts if search_lower in p.get("content", "").lower()]
-                
-                if not posts:
+                    if not line.strip():
+                        continue
+                    try:
+                        post = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if search_lower is not None and search_lower not in post.get("content", "").lower():
+                        continue
+                    total += 1
+                    recent_posts.append(post)
+
+            if total == 0:
+                if search:
                     return f"No posts found matching '{search}'."
-            
-            # Get most recent posts (JSONL is append-only, so last entries are newest)
-            recent_posts = posts[-min(limit, len(posts)):]
-            
+                return "No posts found in channel history."
+
             # Format output
-            output = [f"## Recent Channel Posts ({len(recent_posts)} of {len(posts)} total)"]
+            output = [f"## Recent Channel Posts ({len(recent_posts)} of {total} total)"]
             output.append("")
             
             for post in recent_posts:
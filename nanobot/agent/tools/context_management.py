@@ -1,5 +1,6 @@
 """Context and memory management tools (admin-only)."""
 
+import os
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
@@ -31,11 +32,14 @@ class ClearContextTool(Tool):
         "required": ["action", "confirm"]
     }
     
-    def __init__(self, workspace: Path, admin_ids: list[str], session_manager=None):
+    def __init__(self, workspace: Path, admin_ids: list[str] | frozenset[str], session_manager=None):
         """Initialize with workspace path, admin IDs, and session manager."""
         self.workspace = workspace
-        self.admin_ids = admin_ids
+        self.admin_ids = frozenset(admin_ids or ())
         self.session_manager = session_manager
+        # Resolve the session dict once instead of probing with hasattr on
+        # every execute; the manager keeps mutating this same dict in place
+        self._sessions = getattr(session_manager, 'sessions', None) if session_manager else None
         self._current_user_id = None  # Set by agent loop
     
     def set_user_context(self, user_id: str, is_admin: bool):
@@ -57,12 +61,10 @@ class ClearContextTool(Tool):
         try:
             if action == "session":
                 # Clear current session
-                if self.session_manager and hasattr(self.session_manager, 'sessions'):
-                    cleared = 0
-                    for session_key in list(self.session_manager.sessions.keys()):
-                        session = self.session_manager.sessions[session_key]
+                if self._sessions is not None:
+                    cleared = len(self._sessions)
+                    for session in self._sessions.values():
                         session.clear_history()
-                        cleared += 1
                     logger.info(f"Cleared {cleared} active sessions")
                     return f"✅ Cleared {cleared} active chat session(s). Context reset."
                 else:
@@ -74,15 +76,11 @@ class ClearContextTool(Tool):
                 memory_dir = self.workspace / "memory"
                 
                 cleared_sessions = 0
-                if self.session_manager and hasattr(self.session_manager, 'sessions'):
-                    for session_key in list(self.session_manager.sessions.keys()):
-                        session = self.session_manager.sessions[session_key]
-                        # Filter out today's messages
-                        if hasattr(session, 'messages'):
-                            original_count = len(session.messages)
-                            # Keep only messages from before today (this is simplified)
-                            session.clear_history()
-                            cleared_sessions += 1
+                if self._sessions is not None:
+                    for session in self._sessions.values():
+                        # Keep only messages from before today (this is simplified)
+                        session.clear_history()
+                        cleared_sessions += 1
                 
                 logger.info(f"Cleared today's history from {cleared_sessions} sessions")
                 return f"✅ Cleared today's conversation history from {cleared_sessions} session(s)."
@@ -90,21 +88,28 @@ class ClearContextTool(Tool):
             elif action == "all":
                 # Full reset: clear all sessions + memory files
                 cleared_sessions = 0
-                if self.session_manager and hasattr(self.session_manager, 'sessions'):
-                    for session_key in list(self.session_manager.sessions.keys()):
-                        session = self.session_manager.sessions[session_key]
+                if self._sessions is not None:
+                    cleared_sessions = len(self._sessions)
+                    for session in self._sessions.values():
                         session.clear_history()
-                        cleared_sessions += 1
                 
                 # Optionally clear memory files (be careful!)
-                memory_dir = self.workspace / "memory"
+                # os.scandir + os.rename keeps this a plain directory walk:
+                # no Path objects allocated per entry, one rename syscall each
+                memory_dir = str(self.workspace / "memory")
                 cleared_files = []
-                if memory_dir.exists():
-                    for file_path in memory_dir.glob("*.md"):
-                        # Backup before clearing
-                        backup_path = file_path.with_suffix(f".backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.md")
-                        file_path.rename(backup_path)
-                        cleared_files.append(file_path.name)
+                if os.path.isdir(memory_dir):
+                    # One timestamp for the whole reset: cheaper, and the
+                    # backups of a single operation group together
+                    ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    with os.scandir(memory_dir) as entries:
+                        for entry in entries:
+                            if not entry.is_file() or not entry.name.endswith(".md"):
+                                continue
+                            if ".backup." in entry.name:
+                                continue  # don't re-backup earlier backups
+                            os.rename(entry.path, f"{entry.path[:-3]}.backup.{ts}.md")
+                            cleared_files.append(entry.name)
                 
                 logger.info(f"Full reset: {cleared_sessions} sessions, {len(cleared_files)} memory files backed up")
                 return (
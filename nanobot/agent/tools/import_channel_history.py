@@ -1,9 +1,11 @@
 """Tool for importing channel history from Telegram export JSON."""
 
+import asyncio
 import json
 from pathlib import Path
 from loguru import logger
 from nanobot.agent.tools.base import Tool
+from nanobot.utils.jsonio import json_dumps, json_loads
 
 
 class ImportChannelHistoryTool(Tool):
@@ -26,28 +28,35 @@ class ImportChannelHistoryTool(Tool):
         "required": ["file_path"]
     }
     
-    def __init__(self, workspace: Path, admin_ids: list[str]):
+    def __init__(self, workspace: Path, admin_ids: list[str] | frozenset[str]):
         """Initialize with workspace path and admin IDs."""
         self.workspace = workspace
-        self.admin_ids = admin_ids
+        self.admin_ids = frozenset(admin_ids or ())
         self.histories_dir = workspace / "channel_histories"
         self.histories_dir.mkdir(exist_ok=True)
         self._is_admin = False
+
+        # Current chat context (set by agent loop); the history path is
+        # derived once here rather than re-sanitized on every execute
         self._current_chat_id = None
-    
+        self._history_file = self.workspace / "channel_history.jsonl"
+
     def set_chat_context(self, chat_id: str):
         """Set current chat ID for context isolation."""
+        if chat_id == self._current_chat_id:
+            return
         self._current_chat_id = chat_id
-    
+        if not chat_id:
+            # Fallback to default for backward compatibility
+            self._history_file = self.workspace / "channel_history.jsonl"
+        else:
+            # Sanitize chat_id for filename (remove special chars)
+            safe_chat_id = str(chat_id).replace("-", "neg").replace("|", "_")
+            self._history_file = self.histories_dir / f"chat_{safe_chat_id}.jsonl"
+
     def _get_history_file(self) -> Path:
         """Get history file for current chat."""
-        if not self._current_chat_id:
-            # Fallback to default
-            return self.workspace / "channel_history.jsonl"
-        
-        # Sanitize chat_id for filename
-        safe_chat_id = str(self._current_chat_id).replace("-", "neg").replace("|", "_")
-        return self.histories_dir / f"chat_{safe_chat_id}.jsonl"
+        return self._history_file
     
     def set_user_context(self, user_id: str, is_admin: bool):
         """Set current user context (called by agent loop)."""
@@ -55,86 +64,88 @@ class ImportChannelHistoryTool(Tool):
     
     async def execute(self, file_path: str) -> str:
         """Import channel history from JSON file."""
-        
+
         # CRITICAL: Admin-only check
         if not self._is_admin:
             logger.warning(f"Non-admin attempted to use import_channel_history")
             return "Error: This command is only available to the bot owner (admin)."
-        
+
+        # The parse/write work is fully blocking and can take seconds on a
+        # large export; run it in a worker thread so the agent loop keeps
+        # servicing other chats meanwhile.
+        return await asyncio.to_thread(self._import_sync, file_path)
+
+    def _import_sync(self, file_path: str) -> str:
+        """Synchronous import body (runs in a worker thread)."""
         try:
-            path = Path(file_path)
-            if not path.exists():
-                return f"Error: File not found at {file_path}"
-            
-            # Read JSON export
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read JSON export (bytes: orjson's fast path when available).
+            # Opened directly: a missing file surfaces as FileNotFoundError
+            # below, without a separate exists() stat first.
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
             
             if not isinstance(data, dict) or "messages" not in data:
                 return "Error: Invalid Telegram export format. Expected 'messages' field."
             
             messages = data["messages"]
             channel_name = data.get("name", "Unknown Channel")
-            
-            # Filter for actual posts (not service messages)
-            posts = []
-            for msg in messages:
-                if not isinstance(msg, dict):
-                    continue
-                
-                if msg.get("type") == "service":
-                    continue
-                
-                # Extract text
-                text = msg.get("text", "")
-                
-                # Handle if text is a list (Telegram sometimes exports text as array of strings)
-                if isinstance(text, list):
-                    text = "".join(str(t) for t in text)
-                
-                # If text is empty or just formatting objects, try text_entities
-                if not text and "text_entities" in msg:
-                    text_parts = []
-                    for entity in msg["text_entities"]:
-                        if isinstance(entity, dict) and "text" in entity:
-                            text_parts.append(str(entity["text"]))
-                    text = "".join(text_parts)
-                
-                # Convert to string and validate
-                text = str(text) if text else ""
-                if not text.strip():
-                    continue
-                
-                # Create entry
-                post_id = msg.get("id", 0)
-                date = msg.get("date", "Unknown")
-                from_user = msg.get("from", channel_name)
-                
-                entry = {
-                    "id": post_id,
-                    "date": date,
-                    "from": from_user,
-                    "content": text,
-                    "timestamp": msg.get("date", "")
-                }
-                posts.append(entry)
-            
-            if not posts:
-                return "No valid posts found in the export file."
-            
-            # Write to chat-specific history file (append mode)
+
+            # Filter and write in a single pass: each valid post is serialized
+            # straight into a large-buffered append handle instead of being
+            # collected in an intermediate list first. Peak memory stays
+            # O(1) per post and the JSONL append is one batched write.
             history_file = self._get_history_file()
             imported_count = 0
-            
-            with open(history_file, 'a', encoding='utf-8') as f:
-                for post in posts:
-                    f.write(json.dumps(post, ensure_ascii=False) + '\n')
+
+            with open(history_file, 'a', encoding='utf-8', buffering=1 << 20) as f:
+                for msg in messages:
+                    if not isinstance(msg, dict):
+                        continue
+
+                    if msg.get("type") == "service":
+                        continue
+
+                    # Extract text
+                    text = msg.get("text", "")
+
+                    # Handle if text is a list (Telegram sometimes exports text as array of strings)
+                    if isinstance(text, list):
+                        text = "".join(str(t) for t in text)
+
+                    # If text is empty or just formatting objects, try text_entities
+                    if not text and "text_entities" in msg:
+                        text_parts = []
+                        for entity in msg["text_entities"]:
+                            if isinstance(entity, dict) and "text" in entity:
+                                text_parts.append(str(entity["text"]))
+                        text = "".join(text_parts)
+
+                    # Convert to string and validate (isspace avoids the
+                    # throwaway string that .strip() allocates per message)
+                    text = str(text) if text else ""
+                    if not text or text.isspace():
+                        continue
+
+                    # Emit the line directly from the source fields; no
+                    # intermediate entry dict between decode and write
+                    date = json_dumps(msg.get("date", "Unknown"))
+                    timestamp = date if "date" in msg else '""'
+                    f.write(
+                        f'{{"id":{json_dumps(msg.get("id", 0))},"date":{date},'
+                        f'"from":{json_dumps(msg.get("from", channel_name))},'
+                        f'"content":{json_dumps(text)},"timestamp":{timestamp}}}\n'
+                    )
                     imported_count += 1
+
+            if imported_count == 0:
+                return "No valid posts found in the export file."
             
             chat_context = f" for chat {self._current_chat_id}" if self._current_chat_id else ""
             logger.info(f"Imported {imported_count} posts to channel history{chat_context} from {file_path}")
             return f"✅ Successfully imported {imported_count} posts from {channel_name} into channel history{chat_context}!"
             
+        except FileNotFoundError:
+            return f"Error: File not found at {file_path}"
         except json.JSONDecodeError:
             return "Error: Invalid JSON file."
         except Exception as e:
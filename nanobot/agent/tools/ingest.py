@@ -1,11 +1,16 @@
 """Tool for ingesting chat history."""
 
+import asyncio
+import io
 import json
 import random
+from collections import deque
 from pathlib import Path
-from typing import Any
+
+from loguru import logger
 
 from nanobot.agent.tools.base import Tool as BaseTool
+from nanobot.utils.jsonio import json_loads
 
 
 class IngestHistoryTool(BaseTool):
@@ -35,14 +40,18 @@ class IngestHistoryTool(BaseTool):
     }
     
     async def execute(self, file_path: str, sample_size: int = 20) -> str:
-        path = Path(file_path)
-        if not path.exists():
-            return f"Error: File not found at {file_path}"
-            
+        # Parsing a large export blocks for seconds; do it in a worker
+        # thread so the event loop stays responsive.
+        return await asyncio.to_thread(self._ingest_sync, file_path, sample_size)
+
+    def _ingest_sync(self, file_path: str, sample_size: int) -> str:
+        """Synchronous ingest body (runs in a worker thread)."""
         try:
-            print(f"Ingesting history from {file_path}...")
-            content = path.read_text(encoding="utf-8")
-            data = json.loads(content)
+            logger.debug("Ingesting history from {}", file_path)
+            # Bytes in, orjson's fast path when available. Read directly:
+            # a missing file surfaces as FileNotFoundError below, without
+            # a separate exists() stat first.
+            data = json_loads(Path(file_path).read_bytes())
             
             messages = []
             
@@ -54,21 +63,29 @@ class IngestHistoryTool(BaseTool):
                 # Telegram export format
                 messages = data["messages"]
             
-            print(f"Found {len(messages)} raw items. Filtering for text...")
+            logger.debug("Found {} raw items. Filtering for text...", len(messages))
             
-            # Filter for text messages
-            # Extract text from both "text" field and "text_entities"
-            text_messages = []
+            # Filter for text messages, keeping only the (date, text) pair
+            # each sample actually uses instead of retaining (and mutating)
+            # the full export dicts with all their unused fields.
+            #
+            # Sampling happens inline: Algorithm R keeps a uniform random
+            # reservoir of `sample_size` messages and a bounded deque keeps
+            # the trailing 10, so memory stays O(sample_size + 10) no
+            # matter how large the export is.
+            reservoir: list[tuple[str, str]] = []
+            tail: deque[tuple[str, str]] = deque(maxlen=10)
+            total_count = 0
             for m in messages:
                 if not isinstance(m, dict):
                     continue
-                
+
                 # Skip service messages
                 if m.get("type") == "service":
                     continue
-                
+
                 text = m.get("text", "")
-                
+
                 # Handle text_entities (Telegram export format)
                 if not text and "text_entities" in m:
                     text_parts = []
@@ -76,49 +93,47 @@ class IngestHistoryTool(BaseTool):
                         if isinstance(entity, dict) and "text" in entity:
                             text_parts.append(entity["text"])
                     text = "".join(text_parts)
-                
-                # Only include if there's actual text
-                if text and isinstance(text, str) and len(text.strip()) > 0:
-                    m["text"] = text  # Normalize text field
-                    text_messages.append(m)
-            
-            if not text_messages:
+
+                # Only include if there's actual text (isspace avoids the
+                # throwaway string that .strip() allocates per message)
+                if text and isinstance(text, str) and not text.isspace():
+                    entry = (m.get("date", "Unknown date"), text)
+                    tail.append(entry)
+                    if len(reservoir) < sample_size:
+                        reservoir.append(entry)
+                    else:
+                        j = random.randint(0, total_count)
+                        if j < sample_size:
+                            reservoir[j] = entry
+                    total_count += 1
+
+            if total_count == 0:
                 return "No text messages found in the file."
-                
-            total_count = len(text_messages)
-            print(f"Found {total_count} text messages. Sampling...")
-            
-            # Get last N messages
-            last_n = text_messages[-10:]
-            
-            # Get random samples
-            samples = random.sample(text_messages, min(sample_size, total_count))
-            
-            # Format output
-            output = [
-                f"Successfully ingested {total_count} messages.",
-                "",
-                "## Recent Messages",
-            ]
-            
-            for m in last_n:
-                date = m.get("date", "Unknown date")
-                text = m.get("text", "")[:200]
-                output.append(f"- [{date}] {text}")
-                
-            output.append("")
-            output.append("## Random Samples")
-            
-            for m in samples:
-                text = m.get("text", "")
-                output.append(f"- {text}")
-            
-            print("Ingestion complete. Returning summary.")
-            return "\n".join(output)
+
+            logger.debug("Found {} text messages. Sampling...", total_count)
+
+            # Format output through one StringIO writer instead of growing
+            # a Python list and joining it afterwards
+            buf = io.StringIO()
+            write = buf.write
+            write(f"Successfully ingested {total_count} messages.\n\n## Recent Messages")
+
+            for date, text in tail:
+                write(f"\n- [{date}] {text[:200]}")
+
+            write("\n\n## Random Samples")
+
+            for _, text in reservoir:
+                write(f"\n- {text}")
+
+            logger.info("Ingested {} messages from {}", total_count, file_path)
+            return buf.getvalue()
             
+        except FileNotFoundError:
+            return f"Error: File not found at {file_path}"
         except json.JSONDecodeError:
-            print("Error: Invalid JSON file.")
+            logger.error("Invalid JSON file: {}", file_path)
             return "Error: Invalid JSON file."
         except Exception as e:
-            print(f"Error ingesting history: {str(e)}")
+            logger.error(f"Error ingesting history: {e}")
             return f"Error ingesting history: {str(e)}"
@@ -2,8 +2,6 @@
 
 from pathlib import Path
 from nanobot.agent.tools.base import Tool as BaseTool
-from nanobot.agent.memory import MemoryStore
-from nanobot.agent.persona import PersonaManager
 
 
 class AddToMemoryTool(BaseTool):
@@ -23,12 +21,12 @@ class AddToMemoryTool(BaseTool):
     }
     
     def __init__(self, workspace: Path):
+        # Imported lazily so deployments without this tool skip the module
+        from nanobot.agent.memory import MemoryStore
         self.memory = MemoryStore(workspace)
         
     async def execute(self, content: str) -> str:
-        current = self.memory.read_long_term()
-        new_content = f"{current}\n\n- {content}" if current else f"- {content}"
-        self.memory.write_long_term(new_content)
+        self.memory.append_long_term(f"- {content}")
         return "Successfully added to long-term memory."
 
 
@@ -49,6 +47,8 @@ class UpdatePersonaTool(BaseTool):
     }
     
     def __init__(self, workspace: Path):
+        # Imported lazily so deployments without this tool skip the module
+        from nanobot.agent.persona import PersonaManager
         self.persona = PersonaManager(workspace)
         
     async def execute(self, content: str) -> str:
@@ -7,6 +7,19 @@ from pathlib import Path
 from loguru import logger
 from nanobot.agent.tools.base import Tool
 
+# Compiled once at import; _parse_time runs per reminder and shouldn't pay
+# the regex-cache lookup (or keyword rescans) each call. One alternation
+# covers both relative ("через N час/мин/сек") and absolute (HH:MM) forms
+# so the input is scanned a single time.
+_RE_WHEN = re.compile(r'через\s+(?P<n>\d+)\s+(?P<unit>час|мин|сек)|(?P<hh>\d{1,2}):(?P<mm>\d{2})')
+_UNIT_KWARGS = {"час": "hours", "мин": "minutes", "сек": "seconds"}
+
+# Keyword aliases mapped to a fixed hour-of-day ("next occurrence" rule)
+_KEYWORD_HOURS = (
+    (("вечер", "evening"), 18),
+    (("утр", "morning"), 9),
+)
+
 
 class ReminderTool(Tool):
     """Tool for creating time-based reminders."""
@@ -57,48 +70,29 @@ class ReminderTool(Tool):
         now = datetime.now()
         when_lower = when.lower().strip()
         
-        # Evening (18:00)
-        if "вечер" in when_lower or "evening" in when_lower:
-            target = now.replace(hour=18, minute=0, second=0, microsecond=0)
-            if target < now:
-                target += timedelta(days=1)
-            return target
-        
-        # Morning (9:00)
-        if "утр" in when_lower or "morning" in when_lower:
-            target = now.replace(hour=9, minute=0, second=0, microsecond=0)
-            if target < now:
-                target += timedelta(days=1)
-            return target
-        
+        # Evening (18:00) / morning (9:00)
+        for words, hour in _KEYWORD_HOURS:
+            if any(w in when_lower for w in words):
+                target = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+                if target < now:
+                    target += timedelta(days=1)
+                return target
+
         # Tomorrow
         if "завтра" in when_lower or "tomorrow" in when_lower:
             return (now + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
-        
-        # In N hours
-        hours_match = re.search(r'через\s+(\d+)\s+час', when_lower)
-        if hours_match:
-            hours = int(hours_match.group(1))
-            return now + timedelta(hours=hours)
-        
-        # In N minutes
-        mins_match = re.search(r'через\s+(\d+)\s+мин', when_lower)
-        if mins_match:
-            minutes = int(mins_match.group(1))
-            return now + timedelta(minutes=minutes)
 
-        # In N seconds
-        secs_match = re.search(r'через\s+(\d+)\s+сек', when_lower)
-        if secs_match:
-            seconds = int(secs_match.group(1))
-            return now + timedelta(seconds=seconds)
-        
-        # Specific time: 15:00, 3pm, etc.
-        time_match = re.search(r'(\d{1,2}):(\d{2})', when_lower)
-        if time_match:
-            hour = int(time_match.group(1))
-            minute = int(time_match.group(2))
-            target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        # "через N час/мин/сек" or a specific time like 15:00, in one scan
+        match = _RE_WHEN.search(when_lower)
+        if match:
+            if match.group("unit"):
+                return now + timedelta(**{_UNIT_KWARGS[match.group("unit")]: int(match.group("n"))})
+            target = now.replace(
+                hour=int(match.group("hh")),
+                minute=int(match.group("mm")),
+                second=0,
+                microsecond=0,
+            )
             if target < now:
                 target += timedelta(days=1)
             return target
@@ -1,6 +1,8 @@
 """YouTube video summary tool."""
 
+import asyncio
 import re
+import time
 from loguru import logger
 from nanobot.agent.tools.base import Tool
 
@@ -20,6 +22,60 @@ except ImportError:
     logger.warning("youtube-transcript-api not installed. YouTube summary will not work.")
 
 
+# All supported URL shapes in one compiled alternation: extraction is a
+# single scan instead of a Python loop over separate patterns
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/(?:watch\?v=|embed/|v/|shorts/)|youtu\.be/)([^&\n?#]+)'
+)
+
+
+# Static reply fragments, allocated once instead of per failing call
+_ERR_NO_LIB = "Error: youtube-transcript-api not installed. Run: pip install youtube-transcript-api"
+_ERR_NO_ID = "Error: Could not extract video ID from URL: {}"
+_TRUNC_MARK = "...\n[Transcript truncated due to length]"
+
+
+def _make_pooled_api():
+    """
+    Build a YouTubeTranscriptApi instance backed by a pooled
+    requests.Session, so keep-alive connections span fetches instead of
+    paying a TCP+TLS handshake per call. Returns None on library versions
+    that predate the http_client parameter; callers fall back to the
+    classmethod API (which opens a fresh session per call).
+
+    Transport note: an async httpx/HTTP2 client would avoid the thread
+    hop, but the library only speaks requests, and bypassing it to call
+    the timedtext endpoint directly would mean maintaining our own
+    playlist/caption parsing. Thread offload plus this keep-alive pool
+    captures most of the win without forking that logic.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        return YouTubeTranscriptApi(http_client=session)
+    except (ImportError, TypeError):
+        return None
+
+
+_YT_API = _make_pooled_api() if HAS_YOUTUBE else None
+
+
+def _fetch_raw(video_id: str, languages: list[str] | None = None) -> list[dict]:
+    """Fetch raw transcript entries through the pooled client when available."""
+    if _YT_API is not None:
+        if languages:
+            fetched = _YT_API.fetch(video_id, languages=languages)
+        else:
+            fetched = _YT_API.fetch(video_id)
+        return fetched.to_raw_data()
+    if languages:
+        return YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
+    return YouTubeTranscriptApi.get_transcript(video_id)
+
+
 class YouTubeSummaryTool(Tool):
     """Tool for extracting and summarizing YouTube video transcripts."""
     
@@ -39,48 +95,75 @@ class YouTubeSummaryTool(Tool):
         },
         "required": ["url"]
     }
-    
+
+    # The same link is often shared (or re-analyzed) repeatedly; a fetch
+    # costs a full network round trip, so keep a bounded TTL cache of raw
+    # transcripts keyed by video ID
+    TRANSCRIPT_CACHE_SIZE = 128
+    TRANSCRIPT_CACHE_TTL = 86400.0  # seconds
+
+    # Bound how many transcript fetches may run in worker threads at once
+    # (shared across instances, like the agent loop's tool semaphore)
+    _fetch_sem = asyncio.Semaphore(8)
+
+    def __init__(self):
+        # video_id -> (fetched_at, raw transcript entries)
+        self._transcript_cache: dict[str, tuple[float, list[dict]]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached transcripts."""
+        self._transcript_cache.clear()
+
+    def _get_transcript(self, video_id: str) -> list[dict]:
+        """Fetch the raw transcript, serving repeat videos from the cache."""
+        now = time.monotonic()
+        cached = self._transcript_cache.get(video_id)
+        if cached is not None and now - cached[0] < self.TRANSCRIPT_CACHE_TTL:
+            logger.debug(f"Transcript cache hit for {video_id}")
+            return cached[1]
+
+        try:
+            # Try Russian first, then English
+            logger.debug("Attempting to get transcript in Russian/English...")
+            transcript_data = _fetch_raw(video_id, languages=['ru', 'en'])
+            logger.debug("Got transcript in preferred language")
+        except Exception as lang_err:
+            # Fallback to any available language
+            logger.debug(f"Language preference failed ({lang_err}), trying any available language...")
+            transcript_data = _fetch_raw(video_id)
+            logger.debug("Got transcript in default language")
+
+        if len(self._transcript_cache) >= self.TRANSCRIPT_CACHE_SIZE:
+            # Drop the oldest entry (insertion order) to bound memory
+            self._transcript_cache.pop(next(iter(self._transcript_cache)))
+        self._transcript_cache[video_id] = (now, transcript_data)
+        return transcript_data
+
     def _extract_video_id(self, url: str) -> str | None:
         """Extract video ID from various YouTube URL formats."""
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([^&\n?#]+)',
-            r'youtube\.com\/shorts\/([^&\n?#]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
     
     async def execute(self, url: str) -> str:
         """Extract transcript from YouTube video."""
         if not HAS_YOUTUBE:
-            return "Error: youtube-transcript-api not installed. Run: pip install youtube-transcript-api"
+            return _ERR_NO_LIB
         
         try:
             # Extract video ID
             video_id = self._extract_video_id(url)
             if not video_id:
-                return f"Error: Could not extract video ID from URL: {url}"
+                return _ERR_NO_ID.format(url)
             
             logger.info(f"Extracting transcript for YouTube video: {video_id}")
             
-            # Try to get transcript (prefer Russian, fallback to English or any available)
+            # Try to get transcript (prefer Russian, fallback to English or
+            # any available). The API is synchronous and blocks for the
+            # whole HTTP round trip, so run it in a worker thread instead
+            # of stalling the event loop.
             try:
-                # Try to get transcript with language preference
-                try:
-                    # Try Russian first, then English
-                    logger.debug("Attempting to get transcript in Russian/English...")
-                    transcript_data = YouTubeTranscriptApi.get_transcript(video_id, languages=['ru', 'en'])
-                    logger.debug("Got transcript in preferred language")
-                except Exception as lang_err:
-                    # Fallback to any available language
-                    logger.debug(f"Language preference failed ({lang_err}), trying any available language...")
-                    transcript_data = YouTubeTranscriptApi.get_transcript(video_id)
-                    logger.debug("Got transcript in default language")
-                    
+                async with self._fetch_sem:
+                    transcript_data = await asyncio.to_thread(self._get_transcript, video_id)
             except (TranscriptsDisabled, NoTranscriptFound) as e:
                 logger.error(f"No transcript available: {e}")
                 return f"Error: No transcript available for this video. ({str(e)})"
@@ -88,19 +171,26 @@ class YouTubeSummaryTool(Tool):
                 logger.error(f"Unexpected error getting transcript: {e}")
                 return f"Error: Failed to get transcript: {str(e)}"
             
-            # Format transcript
-            text_parts = []
-            for entry in transcript_data:
-                text_parts.append(entry['text'])
-            
-            full_transcript = ' '.join(text_parts)
-            
-            # Limit length for context (approx 4000 words)
+            # Assemble up to the context budget (approx 4000 words) and
+            # stop: no point materializing a multi-hour transcript only to
+            # slice most of it away afterwards
             max_chars = 16000
-            if len(full_transcript) > max_chars:
-                full_transcript = full_transcript[:max_chars] + "...\n[Transcript truncated due to length]"
+            parts = []
+            total = 0
+            truncated = False
+            for entry in transcript_data:
+                text = entry['text']
+                if total + len(text) + 1 > max_chars:
+                    truncated = True
+                    break
+                parts.append(text)
+                total += len(text) + 1  # +1 for the joining space
+
+            full_transcript = ' '.join(parts)
+            if truncated:
+                full_transcript += _TRUNC_MARK
             
-            logger.info(f"Successfully extracted transcript ({len(text_parts)} segments, {len(full_transcript)} chars)")
+            logger.info(f"Successfully extracted transcript ({len(transcript_data)} segments, {len(full_transcript)} chars)")
             
             return f"YouTube Video Transcript (ID: {video_id}):\n\n{full_transcript}"
             
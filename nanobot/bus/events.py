@@ -5,7 +5,10 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+# slots=True: these are created per message on the hot path, and a fixed
+# layout avoids the per-instance __dict__ (and its GC pressure). Not frozen:
+# the agent loop rewrites content in place for channel posts.
+@dataclass(slots=True)
 class InboundMessage:
     """Message received from a chat channel."""
     
@@ -23,7 +26,7 @@ class InboundMessage:
         return f"{self.channel}:{self.chat_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundMessage:
     """Message to send to a chat channel."""
     
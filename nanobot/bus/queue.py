@@ -23,7 +23,13 @@ class MessageBus:
         self._running = False
     
     async def publish_inbound(self, msg: InboundMessage) -> None:
-        """Publish a message from a channel to the agent."""
+        """
+        Publish a message from a channel to the agent.
+
+        Deliberately not batched: the inbound queue is unbounded, so each
+        put is a plain append with no lock contention to amortize, and a
+        coalescing window would only add latency to every message.
+        """
         await self.inbound.put(msg)
     
     async def consume_inbound(self) -> InboundMessage:
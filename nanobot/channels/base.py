@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from loguru import logger
+
 from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
 
@@ -28,6 +30,11 @@ class BaseChannel(ABC):
         self.config = config
         self.bus = bus
         self._running = False
+        # Allow-list membership is checked per message; normalize it to a
+        # frozenset once instead of scanning a list every time
+        self._allow_set = frozenset(
+            str(x) for x in (getattr(config, "allow_from", None) or ())
+        )
     
     @abstractmethod
     async def start(self) -> None:
@@ -59,33 +66,33 @@ class BaseChannel(ABC):
     def is_allowed(self, sender_id: str) -> bool:
         """
         Check if a sender is allowed to use this bot.
-        
+
         Args:
-            sender_id: The sender's identifier.
-        
+            sender_id: The sender's identifier, already a string (callers
+                stringify once; this method does no conversion).
+
         Returns:
             True if allowed, False otherwise.
         """
-        from loguru import logger
-        
-        allow_list = getattr(self.config, "allow_from", [])
-        
-        # If no allow list, allow everyone
-        if not allow_list:
-            logger.debug(f"No allow list configured, allowing sender: {sender_id}")
+        # If no allow list, allow everyone. Hot-path logs use lazy
+        # formatting so INFO-level runs skip the string work entirely.
+        if not self._allow_set:
+            logger.opt(lazy=True).debug("No allow list configured, allowing sender: {}", lambda: sender_id)
             return True
-        
-        sender_str = str(sender_id)
-        if sender_str in allow_list:
-            logger.debug(f"Sender {sender_id} allowed (exact match)")
+
+        if sender_id in self._allow_set:
+            logger.opt(lazy=True).debug("Sender {} allowed (exact match)", lambda: sender_id)
             return True
-        if "|" in sender_str:
-            for part in sender_str.split("|"):
-                if part and part in allow_list:
-                    logger.debug(f"Sender {sender_id} allowed (part '{part}' matched)")
+        if "|" in sender_id:
+            for part in sender_id.split("|"):
+                if part and part in self._allow_set:
+                    logger.opt(lazy=True).debug(
+                        "Sender {s} allowed (part '{p}' matched)",
+                        s=lambda: sender_id, p=lambda part=part: part,
+                    )
                     return True
-        
-        logger.warning(f"Sender {sender_id} BLOCKED by allowFrom filter. Allow list: {allow_list}")
+
+        logger.warning(f"Sender {sender_id} BLOCKED by allowFrom filter. Allow list: {sorted(self._allow_set)}")
         return False
     
     async def _handle_message(
@@ -110,22 +117,29 @@ class BaseChannel(ABC):
             metadata: Optional channel-specific metadata.
             skip_allow_check: If True, skip allowFrom check (e.g. for group chats).
         """
-        from loguru import logger
-        
+        # Stringify once; the allow check, the logs, and the message all
+        # want the same representation
+        sid = str(sender_id)
+        cid = str(chat_id)
+
         # In group chats, allow everyone. In private chats, check allowFrom.
-        if not skip_allow_check and not self.is_allowed(sender_id):
-            logger.warning(f"Message from {sender_id} blocked by allowFrom filter (private chat)")
-            return
-        
+        # One branch on skip_allow_check covers both the group fast path
+        # and the private-chat filter.
         if skip_allow_check:
-            logger.debug(f"Skipping allowFrom check for {sender_id} (group chat)")
-        
-        logger.info(f"Publishing message to bus: sender={sender_id}, chat={chat_id}, content_preview={content[:50]}...")
-        
+            logger.opt(lazy=True).debug("Skipping allowFrom check for {} (group chat)", lambda: sid)
+        elif not self.is_allowed(sid):
+            logger.warning(f"Message from {sid} blocked by allowFrom filter (private chat)")
+            return
+
+        logger.opt(lazy=True).info(
+            "Publishing message to bus: sender={s}, chat={c}, content_preview={p}...",
+            s=lambda: sid, c=lambda: cid, p=lambda: content[:50],
+        )
+
         msg = InboundMessage(
             channel=self.name,
-            sender_id=str(sender_id),
-            chat_id=str(chat_id),
+            sender_id=sid,
+            chat_id=cid,
             content=content,
             media=media or [],
             metadata=metadata or {}
@@ -1,86 +1,175 @@
 """Telegram channel implementation using python-telegram-bot."""
 
 import asyncio
+import hashlib
+import random
 import re
 import os
-import tempfile
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
 
+import httpx
 from loguru import logger
-from telegram import Update, InlineQueryResultArticle, InputTextMessageContent
-from telegram.ext import Application, MessageHandler, filters, ContextTypes, InlineQueryHandler
+from telegram import Update, InlineQueryResultArticle, InputTextMessageContent, ReactionTypeEmoji
+from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, InlineQueryHandler
 
 try:
     import edge_tts
 except ImportError:
     edge_tts = None
 
+# Optional native-search dependency for the inline-query fallback; imported
+# once here so the hot handlers never pay import-machinery lookups
+try:
+    from google import genai
+    from google.genai import types as genai_types
+except ImportError:
+    genai = None
+    genai_types = None
+
+from nanobot.agent.tools.web import WebSearchTool
 from nanobot.bus.events import OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
+from nanobot.config.loader import load_config
 from nanobot.config.schema import TelegramConfig
+from nanobot.providers.litellm_provider import LiteLLMProvider
+from nanobot.utils.jsonio import json_dumps
+
+
+# Markdown-to-HTML patterns, compiled once at import instead of on every
+# message (re.sub with a string pattern pays a cache lookup per call)
+_RE_CODE = re.compile(r'```[\w]*\n?(?P<block>[\s\S]*?)```|`(?P<inline>[^`]+)`')
+_RE_HEADER = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_RE_BLOCKQUOTE = re.compile(r'^>\s*(.*)$', re.MULTILINE)
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_BOLD_STARS = re.compile(r'\*\*(.+?)\*\*')
+_RE_BOLD_UNDERSCORES = re.compile(r'__(.+?)__')
+_RE_ITALIC = re.compile(r'(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])')
+_RE_STRIKETHROUGH = re.compile(r'~~(.+?)~~')
+_RE_BULLET = re.compile(r'^[-*]\s+', re.MULTILINE)
+
+# One-pass HTML escaping: str.translate walks the string once instead of
+# the three full copies that chained .replace() calls make
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+def _is_meaningful(text: str, min_chars: int = 3) -> bool:
+    """
+    Check whether a message has at least `min_chars` characters of actual
+    text (filters out emoji-only and punctuation-only replies).
+
+    Short-circuits on the first qualifying characters instead of building
+    a stripped copy of the whole message just to measure its length.
+    """
+    n = 0
+    for c in text:
+        if c.isalnum():
+            n += 1
+            if n >= min_chars:
+                return True
+    return False
+
+
+# Characters that can open any markdown construct the converter handles.
+# If none appear, the text needs nothing beyond HTML escaping.
+_MD_SENTINELS = '`*_[~#>-'
+
+# TTS cleanup in one pass: markdown chars plus emojis/special chars.
+# The explicit _ matters — it sits inside \w, so the negated class alone
+# would leave it in.
+_RE_TTS_CLEAN = re.compile(r'_|[^\w\s\.,!?\-]')
+
+# Media extension lookups, built once instead of per download
+_EXT_BY_MIME = {
+    "image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif",
+    "audio/ogg": ".ogg", "audio/mpeg": ".mp3", "audio/mp4": ".m4a",
+}
+_EXT_BY_TYPE = {"image": ".jpg", "voice": ".ogg", "audio": ".mp3", "file": ""}
+
+
+# A given channel sees the same handful of (media_type, mime_type) pairs
+# over and over; memoized, repeat lookups are one cache probe
+@lru_cache(maxsize=64)
+def _get_extension(media_type: str, mime_type: str | None) -> str:
+    """Get file extension based on media type."""
+    if mime_type and mime_type in _EXT_BY_MIME:
+        return _EXT_BY_MIME[mime_type]
+    return _EXT_BY_TYPE.get(media_type, "")
+
+
+def _convert_prose(text: str) -> str:
+    """Run the non-code markdown conversions on a code-free fragment."""
+    if not text:
+        return ""
+
+    # 1. Headers # Title -> just the title text
+    text = _RE_HEADER.sub(r'\1', text)
+
+    # 2. Blockquotes > text -> just the text (before HTML escaping)
+    text = _RE_BLOCKQUOTE.sub(r'\1', text)
+
+    # 3. Escape HTML special characters
+    text = text.translate(_HTML_ESCAPE_TABLE)
+
+    # 4. Links [text](url) - must be before bold/italic to handle nested cases
+    text = _RE_LINK.sub(r'<a href="\2">\1</a>', text)
 
+    # 5. Bold **text** or __text__
+    text = _RE_BOLD_STARS.sub(r'<b>\1</b>', text)
+    text = _RE_BOLD_UNDERSCORES.sub(r'<b>\1</b>', text)
 
+    # 6. Italic _text_ (avoid matching inside words like some_var_name)
+    text = _RE_ITALIC.sub(r'<i>\1</i>', text)
+
+    # 7. Strikethrough ~~text~~
+    text = _RE_STRIKETHROUGH.sub(r'<s>\1</s>', text)
+
+    # 8. Bullet lists - item -> • item
+    text = _RE_BULLET.sub('• ', text)
+
+    return text
+
+
+@lru_cache(maxsize=512)
 def _markdown_to_telegram_html(text: str) -> str:
     """
     Convert markdown to Telegram-safe HTML.
+
+    Single left-to-right pass: code spans are emitted directly as escaped
+    <pre>/<code> fragments and the prose between them runs through the
+    regex pipeline, so code content is never touched by the prose rules
+    and there is no placeholder protect/restore step rescanning the whole
+    string once per code block.
+
+    Pure function of the text, so results are memoized: retries after a
+    send failure and repeated canned replies skip the whole regex pipeline.
     """
     if not text:
         return ""
-    
-    # 1. Extract and protect code blocks (preserve content from other processing)
-    code_blocks: list[str] = []
-    def save_code_block(m: re.Match) -> str:
-        code_blocks.append(m.group(1))
-        return f"\x00CB{len(code_blocks) - 1}\x00"
-    
-    text = re.sub(r'```[\w]*\n?([\s\S]*?)```', save_code_block, text)
-    
-    # 2. Extract and protect inline code
-    inline_codes: list[str] = []
-    def save_inline_code(m: re.Match) -> str:
-        inline_codes.append(m.group(1))
-        return f"\x00IC{len(inline_codes) - 1}\x00"
-    
-    text = re.sub(r'`([^`]+)`', save_inline_code, text)
-    
-    # 3. Headers # Title -> just the title text
-    text = re.sub(r'^#{1,6}\s+(.+)$', r'\1', text, flags=re.MULTILINE)
-    
-    # 4. Blockquotes > text -> just the text (before HTML escaping)
-    text = re.sub(r'^>\s*(.*)$', r'\1', text, flags=re.MULTILINE)
-    
-    # 5. Escape HTML special characters
-    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    
-    # 6. Links [text](url) - must be before bold/italic to handle nested cases
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
-    
-    # 7. Bold **text** or __text__
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'__(.+?)__', r'<b>\1</b>', text)
-    
-    # 8. Italic _text_ (avoid matching inside words like some_var_name)
-    text = re.sub(r'(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])', r'<i>\1</i>', text)
-    
-    # 9. Strikethrough ~~text~~
-    text = re.sub(r'~~(.+?)~~', r'<s>\1</s>', text)
-    
-    # 10. Bullet lists - item -> • item
-    text = re.sub(r'^[-*]\s+', '• ', text, flags=re.MULTILINE)
-    
-    # 11. Restore inline code with HTML tags
-    for i, code in enumerate(inline_codes):
-        # Escape HTML in code content
-        escaped = code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        text = text.replace(f"\x00IC{i}\x00", f"<code>{escaped}</code>")
-    
-    # 12. Restore code blocks with HTML tags
-    for i, code in enumerate(code_blocks):
-        # Escape HTML in code content
-        escaped = code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        text = text.replace(f"\x00CB{i}\x00", f"<pre><code>{escaped}</code></pre>")
-    
-    return text
+
+    # Fast path: most replies are plain prose. Each `c in text` is a
+    # C-level memchr scan, far cheaper than running the regex pipeline
+    # just to discover there was nothing to convert.
+    if not any(c in text for c in _MD_SENTINELS):
+        return text.translate(_HTML_ESCAPE_TABLE)
+
+    parts: list[str] = []
+    pos = 0
+    for m in _RE_CODE.finditer(text):
+        parts.append(_convert_prose(text[pos:m.start()]))
+        block = m.group('block')
+        if block is not None:
+            parts.append(f"<pre><code>{block.translate(_HTML_ESCAPE_TABLE)}</code></pre>")
+        else:
+            parts.append(f"<code>{m.group('inline').translate(_HTML_ESCAPE_TABLE)}</code>")
+        pos = m.end()
+    parts.append(_convert_prose(text[pos:]))
+
+    return "".join(parts)
 
 
 class TelegramChannel(BaseChannel):
@@ -98,10 +187,60 @@ class TelegramChannel(BaseChannel):
         self._app: Application | None = None
         self._chat_ids: dict[str, int] = {}  # Map sender_id to chat_id for replies
         self._user_states: dict[str, str] = {}  # Track user states (e.g. 'waiting_for_history')
+        self._inline_cfg: tuple[str | None, str | None, str] | None = None  # (api_key, brave_key, model)
+        # Built lazily on first inline query, then reused: both clients
+        # carry HTTP connection pools, so recreating them per query throws
+        # away keep-alive sockets and TLS sessions
+        self._inline_provider: LiteLLMProvider | None = None
+        self._genai_client = None
+        self._shutdown = asyncio.Event()
+        # Background channel-post saves; holding a reference keeps the
+        # tasks from being GC'd mid-flight
+        self._pending_saves: set[asyncio.Task] = set()
+        # allow_from membership comes pre-built as a frozenset on the base
+        # channel (self._allow_set); mirror that for allow_chats so both
+        # checks are O(1) hash lookups instead of list scans per message
+        self._allow_chats: frozenset[str] = frozenset(
+            str(x) for x in (getattr(config, "allow_chats", None) or ())
+        )
+        # Media download target, created once here: doing the mkdir per
+        # message meant a mkdir(2) syscall per media file even when the
+        # directory already existed
+        self._media_dir = Path.home() / ".nanobot" / "media"
+        self._media_dir.mkdir(parents=True, exist_ok=True)
+        # Lowercased @mention of the bot, refreshed from get_me() at
+        # startup; lets the mention check be one substring scan instead of
+        # slicing and lowercasing per entity
+        self._bot_mention = "@cloptbot_bot"
         
         # Trigger keywords for group chat
         self.direct_triggers = ["клоп", "бот", "клопбот", "clopbot", "бро"]  # Direct mentions
         self.context_triggers = ["tonify", "ton", "nigredo", "web3", "degen", "spotify", "soundcloud"]  # Context triggers for random responses
+
+        # Both trigger lists compiled into one alternation with named groups,
+        # so a group message is scanned once for every keyword at the same
+        # time (the same single-pass idea as an Aho-Corasick/Hyperscan
+        # scanner, but without pulling in a dedicated dependency for a
+        # dozen keywords; a real multi-pattern engine only starts paying
+        # off once the trigger set reaches hundreds of entries).
+        # Longest-first ordering keeps overlapping prefixes ("клопбот" vs
+        # "клоп", "tonify" vs "ton") from forcing extra alternation
+        # backtracking. Word boundary \b avoids matching "работать" for
+        # "бот" or "клоповник" for "клоп".
+        self._trigger_re = re.compile(
+            r'\b(?:(?P<direct>'
+            + '|'.join(re.escape(t) for t in sorted(self.direct_triggers, key=len, reverse=True))
+            + r')|(?P<context>'
+            + '|'.join(re.escape(t) for t in sorted(self.context_triggers, key=len, reverse=True))
+            + r'))\b'
+        )
+
+        # Prefilters so short interjections and emoji spam never reach the
+        # regex: a message shorter than the shortest trigger, or one that
+        # contains none of the triggers' first characters, cannot match
+        all_triggers = self.direct_triggers + self.context_triggers
+        self._min_trigger_len = min(len(t) for t in all_triggers)
+        self._trigger_first_chars = frozenset(t[0] for t in all_triggers)
     
     async def start(self) -> None:
         """Start the Telegram bot with long polling."""
@@ -111,10 +250,15 @@ class TelegramChannel(BaseChannel):
         
         self._running = True
         
-        # Build the application
+        # Build the application. A wider connection pool lets concurrent
+        # handlers (media downloads, sends, reactions) reuse keep-alive
+        # connections to api.telegram.org instead of queueing on the
+        # default single-digit pool or re-establishing TLS.
         self._app = (
             Application.builder()
             .token(self.config.token)
+            .connection_pool_size(32)
+            .pool_timeout(10.0)
             .build()
         )
         
@@ -142,7 +286,6 @@ class TelegramChannel(BaseChannel):
         # )
         
         # Add /start command handler
-        from telegram.ext import CommandHandler
         self._app.add_handler(CommandHandler("start", self._on_start))
         self._app.add_handler(CommandHandler("init", self._on_init))
         
@@ -158,6 +301,8 @@ class TelegramChannel(BaseChannel):
         # Get bot info
         bot_info = await self._app.bot.get_me()
         logger.info(f"Telegram bot @{bot_info.username} connected")
+        if bot_info.username:
+            self._bot_mention = "@" + bot_info.username.lower()
         
         # Start polling (this runs until stopped)
         await self._app.updater.start_polling(
@@ -165,14 +310,16 @@ class TelegramChannel(BaseChannel):
             drop_pending_updates=True  # Ignore old messages on startup
         )
         
-        # Keep running until stopped
-        while self._running:
-            await asyncio.sleep(1)
+        # Keep running until stopped (event wait instead of a 1Hz poll:
+        # no wakeups while idle)
+        self._shutdown.clear()
+        await self._shutdown.wait()
     
     async def stop(self) -> None:
         """Stop the Telegram bot."""
         self._running = False
-        
+        self._shutdown.set()
+
         if self._app:
             logger.info("Stopping Telegram bot...")
             await self._app.updater.stop()
@@ -187,91 +334,105 @@ class TelegramChannel(BaseChannel):
         Returns:
             (should_respond, reason)
         """
-        import random
-        import re
-        
         if not text:
             return False, "no_text"
-        
+
         text_lower = text.lower()
-        
+
         # Always respond to direct @mention
         if has_mention:
             return True, "direct_mention"
-        
-        # Check for direct trigger keywords as WHOLE WORDS (not substrings)
-        # Using word boundary \b to avoid matching "работать" for "бот" or "клоповник" for "клоп"
-        for trigger in self.direct_triggers:
-            # Pattern: word boundary + trigger + word boundary
-            pattern = r'\b' + re.escape(trigger) + r'\b'
-            if re.search(pattern, text_lower):
-                return True, f"trigger_{trigger}"
-        
-        # Check for context triggers with probability (also as whole words)
-        for trigger in self.context_triggers:
-            pattern = r'\b' + re.escape(trigger) + r'\b'
-            if re.search(pattern, text_lower):
-                # 20% chance to respond to context triggers
-                if random.random() < 0.2:
-                    return True, f"random_context_{trigger}"
-        
+
+        # Cheap prefilters before the regex (see __init__)
+        if len(text_lower) < self._min_trigger_len:
+            return False, "too_short"
+        first_chars = self._trigger_first_chars
+        if not any(c in first_chars for c in text_lower):
+            return False, "no_prefix_char"
+
+        # One pass over the text matches every keyword simultaneously.
+        # Direct triggers win wherever they appear; the first context
+        # trigger is remembered in case no direct trigger shows up.
+        context_word = None
+        for m in self._trigger_re.finditer(text_lower):
+            word = m.group('direct')
+            if word:
+                return True, f"trigger_{word}"
+            if context_word is None:
+                context_word = m.group('context')
+
+        # 20% chance to respond to context triggers
+        if context_word and random.random() < 0.2:
+            return True, f"random_context_{context_word}"
+
         return False, "no_trigger"
     
     async def _save_channel_post(self, post_id: int, content: str, date: str, from_user: str, chat_id: int) -> None:
-        """Save channel post to chat-specific history file for context."""
+        """Save channel post to chat-specific history file for context.
+
+        The open/write/close runs in a worker thread so a slow disk never
+        stalls the event loop (and whatever LLM call shares it).
+        """
         try:
-            from pathlib import Path
-            import json
-            
-            # Get workspace from config
-            workspace = Path.home() / ".nanobot" / "workspace"
-            histories_dir = workspace / "channel_histories"
-            histories_dir.mkdir(exist_ok=True)
-            
-            # Create chat-specific history file
-            safe_chat_id = str(chat_id).replace("-", "neg").replace("|", "_")
-            history_file = histories_dir / f"chat_{safe_chat_id}.jsonl"
-            
-            # Create entry
-            entry = {
-                "id": post_id,
-                "date": date,
-                "from": from_user,
-                "content": content,
-                "timestamp": __import__('datetime').datetime.now().isoformat()
-            }
-            
-            # Append to JSONL file
-            with open(history_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-            
+            await asyncio.to_thread(
+                self._save_channel_post_sync, post_id, content, date, from_user, chat_id
+            )
             logger.debug(f"Saved post #{post_id} to channel history")
-            
         except Exception as e:
             logger.error(f"Failed to save channel post to history: {e}")
+
+    def _save_channel_post_sync(self, post_id: int, content: str, date: str, from_user: str, chat_id: int) -> None:
+        """Blocking body of _save_channel_post (runs in a worker thread)."""
+        # Get workspace from config
+        workspace = Path.home() / ".nanobot" / "workspace"
+        histories_dir = workspace / "channel_histories"
+        histories_dir.mkdir(exist_ok=True)
+
+        # Create chat-specific history file
+        safe_chat_id = str(chat_id).replace("-", "neg").replace("|", "_")
+        history_file = histories_dir / f"chat_{safe_chat_id}.jsonl"
+
+        # Create entry
+        entry = {
+            "id": post_id,
+            "date": date,
+            "from": from_user,
+            "content": content,
+            "timestamp": datetime.now().isoformat()
+        }
+
+        # Append to JSONL file (json_dumps uses orjson when available)
+        with open(history_file, 'a', encoding='utf-8') as f:
+            f.write(json_dumps(entry) + '\n')
     
-    async def _generate_voice(self, text: str) -> str | None:
-        """Generate voice from text using edge-tts."""
+    async def _generate_voice(self, text: str) -> BytesIO | None:
+        """Generate voice from text using edge-tts, returning an in-memory buffer."""
         if not edge_tts:
             logger.warning("edge-tts not installed, skipping voice generation")
             return None
-            
+
         try:
             # Clean text for TTS (remove markdown, emojis, special chars)
-            clean_text = re.sub(r'[*_`]', '', text)  # Remove markdown
-            clean_text = re.sub(r'[^\w\s\.,!?\-]', '', clean_text)  # Remove emojis and special chars
-            clean_text = clean_text.strip()
-            
+            clean_text = _RE_TTS_CLEAN.sub('', text).strip()
+
             # Use Russian male voice with 1.2x speed
             voice = "ru-RU-DmitryNeural"
             communicate = edge_tts.Communicate(clean_text, voice, rate="+20%")
-            
-            # Create temp file
-            fd, path = tempfile.mkstemp(suffix=".mp3")
-            os.close(fd)
-            
-            await communicate.save(path)
-            return path
+
+            # Collect audio in memory: the bytes only live for one upload,
+            # so there is no reason to round-trip them through a temp file.
+            # (Chunks can't be piped straight into the upload — the bot
+            # API client wants a complete file object, not a generator —
+            # so one in-memory buffer is as close to streaming as we get.)
+            buf = BytesIO()
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    buf.write(chunk["data"])
+            if not buf.getbuffer().nbytes:
+                logger.warning("TTS produced no audio, skipping voice reply")
+                return None
+            buf.seek(0)
+            return buf
         except Exception as e:
             logger.error(f"TTS generation failed: {e}")
             return None
@@ -296,19 +457,16 @@ class TelegramChannel(BaseChannel):
             should_use_voice = msg.metadata.get("voice", False) and edge_tts
             
             if should_use_voice:
-                voice_path = await self._generate_voice(msg.content)
-                if voice_path:
+                voice_buf = await self._generate_voice(msg.content)
+                if voice_buf:
                     try:
                         # Send voice note WITHOUT caption (voice only)
-                        with open(voice_path, "rb") as f:
-                            await self._app.bot.send_voice(
-                                chat_id=chat_id,
-                                voice=f,
-                                **reply_kwargs
-                            )
+                        await self._app.bot.send_voice(
+                            chat_id=chat_id,
+                            voice=voice_buf,
+                            **reply_kwargs
+                        )
                         logger.info("Voice message sent successfully")
-                        # Clean up
-                        os.unlink(voice_path)
                         return
                     except Exception as e:
                         logger.error(f"Failed to send voice: {e}")
@@ -324,7 +482,7 @@ class TelegramChannel(BaseChannel):
                     parse_mode="HTML",
                     **reply_kwargs
                 )
-                logger.info(f"Message sent to {chat_id}")
+                logger.opt(lazy=True).info("Message sent to {c}", c=lambda: chat_id)
             except Exception as html_error:
                 # Only fallback to plain text if HTML parsing specifically failed
                 error_str = str(html_error).lower()
@@ -360,8 +518,6 @@ class TelegramChannel(BaseChannel):
             return False
         
         try:
-            from telegram import ReactionTypeEmoji
-            
             await self._app.bot.set_message_reaction(
                 chat_id=int(chat_id),
                 message_id=message_id,
@@ -374,6 +530,36 @@ class TelegramChannel(BaseChannel):
             logger.debug(f"Could not set reaction: {e}")
             return False
     
+    async def _download_file(self, file, dest: Path) -> None:
+        """
+        Download a Telegram file to disk in bounded chunks.
+
+        File.download_to_drive buffers the whole payload in memory before
+        writing it out; streaming 64 KiB chunks keeps memory flat for
+        large audio/video files. Falls back to download_to_drive when the
+        file path is not a plain URL (e.g. a local Bot API server).
+
+        Writes go to a .part sibling and are renamed into place only on
+        success, so dest never holds a truncated file — the media dedup in
+        _on_message treats any existing dest as a complete download.
+        """
+        tmp = dest.with_name(dest.name + ".part")
+        try:
+            url = file.file_path
+            if not url or not str(url).startswith("http"):
+                await file.download_to_drive(str(tmp))
+            else:
+                async with httpx.AsyncClient(timeout=60.0) as client:
+                    async with client.stream("GET", url) as resp:
+                        resp.raise_for_status()
+                        with open(tmp, "wb") as f:
+                            async for chunk in resp.aiter_bytes(64 * 1024):
+                                f.write(chunk)
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
     async def _on_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /start command."""
         if not update.message or not update.effective_user:
@@ -408,15 +594,20 @@ class TelegramChannel(BaseChannel):
             return
         
         query = update.inline_query.query
-        logger.info(f"INLINE QUERY: '{query}' from user {update.inline_query.from_user.id}")
+        logger.opt(lazy=True).info(
+            "INLINE QUERY: '{q}' from user {u}",
+            q=lambda: query, u=lambda: update.inline_query.from_user.id,
+        )
         user = update.inline_query.from_user
         user_id = str(user.id)
         
-        logger.info(f"Inline query from {user.username or user_id}: {query[:50]}...")
+        logger.opt(lazy=True).info(
+            "Inline query from {u}: {q}...",
+            u=lambda: user.username or user_id, q=lambda: query[:50],
+        )
         
         # Admin-only check
-        allow_list = getattr(self.config, "allow_from", [])
-        is_admin = allow_list and user_id in allow_list
+        is_admin = bool(self._allow_set) and user_id in self._allow_set
         
         if not is_admin:
             # Non-admin: show "access denied" result
@@ -449,107 +640,137 @@ class TelegramChannel(BaseChannel):
             return
         
         # Call LLM directly for quick inline response
-        logger.info(f"Processing inline query: {query[:30]}...")
+        logger.opt(lazy=True).info("Processing inline query: {q}...", q=lambda: query[:30])
         try:
-            import hashlib
-            import json
-            from nanobot.providers.litellm_provider import LiteLLMProvider
-            from nanobot.config.loader import load_config
-            from nanobot.agent.tools.web import WebSearchTool
-            
-            # Create stable ID from query
-            query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
+            # Create stable ID from query. crc32 is a fast non-crypto
+            # checksum; the ID only needs to be stable and 8 hex chars, so
+            # a full MD5 digest (of which we kept 4 bytes) was overkill.
+            query_hash = format(zlib.crc32(query.encode()), '08x')
             display_query = query[:50] + "..." if len(query) > 50 else query
             
             # Quick LLM call
             try:
-                logger.info("Loading config for inline LLM...")
-                config = load_config()
-                
-                # Check API keys
-                api_key = config.get_api_key()
-                brave_key = config.tools.web.search.api_key or os.environ.get("BRAVE_API_KEY")
-                
-                # Use fastest model for inline
-                # If using Gemini, switch to Flash for speed
-                model = config.agents.defaults.model
-                if "gemini" in model.lower():
-                    # User requested specific model alias
-                    model = "gemini/gemini-flash-lite-latest"
-                    os.environ["GEMINI_API_KEY"] = api_key
-                elif api_key:
-                     # Setup other env vars
-                     if "claude" in model.lower(): os.environ["ANTHROPIC_API_KEY"] = api_key
-                     if "gpt" in model.lower(): os.environ["OPENAI_API_KEY"] = api_key
-
-                provider = LiteLLMProvider(
-                    api_key=api_key,
-                    default_model=model
-                )
-                
-                context_info = ""
-                
-                # STRATEGY 1: Brave Search (Fastest & Best)
-                if brave_key:
-                    logger.info("Using Brave Search for speed...")
-                    try:
-                        search_tool = WebSearchTool(api_key=brave_key, max_results=2)
-                        # Execute search manually BEFORE calling LLM (saves 1 roundtrip)
-                        search_results = await asyncio.wait_for(
-                            search_tool.execute(query), 
-                            timeout=3.0
+                # Config, keys and the model alias don't change between
+                # queries; resolve them once and reuse (saves a config file
+                # read + pydantic parse per inline query)
+                if self._inline_cfg is None:
+                    logger.info("Loading config for inline LLM...")
+                    config = load_config()
+
+                    # Check API keys
+                    api_key = config.get_api_key()
+                    brave_key = config.tools.web.search.api_key or os.environ.get("BRAVE_API_KEY")
+
+                    # Use fastest model for inline
+                    # If using Gemini, switch to Flash for speed
+                    model = config.agents.defaults.model
+                    if "gemini" in model.lower():
+                        # User requested specific model alias
+                        model = "gemini/gemini-flash-lite-latest"
+                        os.environ["GEMINI_API_KEY"] = api_key
+                    elif api_key:
+                        # Setup other env vars
+                        if "claude" in model.lower(): os.environ["ANTHROPIC_API_KEY"] = api_key
+                        if "gpt" in model.lower(): os.environ["OPENAI_API_KEY"] = api_key
+
+                    self._inline_cfg = (api_key, brave_key, model)
+
+                api_key, brave_key, model = self._inline_cfg
+
+                if self._inline_provider is None:
+                    self._inline_provider = LiteLLMProvider(
+                        api_key=api_key,
+                        default_model=model
+                    )
+                provider = self._inline_provider
+
+                # STRATEGY 1: Brave Search (fast, yields context for the LLM)
+                async def _brave_search() -> str:
+                    search_tool = WebSearchTool(api_key=brave_key, max_results=2)
+                    # Execute search manually BEFORE calling LLM (saves 1 roundtrip)
+                    search_results = await asyncio.wait_for(
+                        search_tool.execute(query),
+                        timeout=3.0
+                    )
+                    logger.info("Brave search successful")
+                    return f"SEARCH RESULTS:\n{search_results}\n\n"
+
+                # STRATEGY 2: Google Native (yields a finished answer)
+                async def _native_search() -> str:
+                    if self._genai_client is None:
+                        self._genai_client = genai.Client(api_key=api_key)
+                    client = self._genai_client
+                    # Use stable Flash model for native search tools
+                    native_model = "gemini-2.5-flash-lite"
+
+                    logger.info(f"Calling native GenerateContent ({native_model})...")
+
+                    # Run sync call in thread
+                    def _native_generate():
+                        # Enforce Russian and brevity in prompt
+                        enhanced_query = (
+                            f"Ответь на русском языке. Будь краток (макс 300 символов). "
+                            f"Используй Google Search чтобы найти актуальную информацию. "
+                            f"Вопрос пользователя: {query}"
                         )
-                        context_info = f"SEARCH RESULTS:\n{search_results}\n\n"
-                        logger.info("Brave search successful")
-                    except Exception as e:
-                        logger.error(f"Brave search failed: {e}")
-                        context_info = ""
-                
-                # STRATEGY 2: Google Native (Fallback)
-                # Use if (No Brave OR Brave failed) AND using Gemini
-                tools = None
-                answer = None
-                
-                # If we don't have context from Brave, try Google Native
-                if not context_info and "gemini" in model.lower():
-                    logger.info("Using Gemini Native Search (via google.genai) as fallback...")
-                    try:
-                        from google import genai
-                        from google.genai import types
-                        
-                        client = genai.Client(api_key=api_key)
-                        # Use stable Flash model for native search tools
-                        native_model = "gemini-2.5-flash-lite" 
-                        
-                        logger.info(f"Calling native GenerateContent ({native_model})...")
-                        
-                        # Run sync call in thread
-                        def _native_generate():
-                            # Enforce Russian and brevity in prompt
-                            enhanced_query = (
-                                f"Ответь на русском языке. Будь краток (макс 300 символов). "
-                                f"Используй Google Search чтобы найти актуальную информацию. "
-                                f"Вопрос пользователя: {query}"
-                            )
-                            
-                            response = client.models.generate_content(
-                                model=native_model,
-                                contents=enhanced_query,
-                                config=types.GenerateContentConfig(
-                                    tools=[types.Tool(google_search=types.GoogleSearch())],
-                                    max_output_tokens=300
-                                )
+
+                        response = client.models.generate_content(
+                            model=native_model,
+                            contents=enhanced_query,
+                            config=genai_types.GenerateContentConfig(
+                                tools=[genai_types.Tool(google_search=genai_types.GoogleSearch())],
+                                max_output_tokens=300
                             )
-                            return response.text
+                        )
+                        return response.text
+
+                    native_answer = await asyncio.to_thread(_native_generate)
+                    logger.info(f"Native answer: {native_answer[:50]}...")
+                    return native_answer
+
+                # Race both strategies instead of running them serially:
+                # p50 becomes min(Brave, Gemini) within the 9s budget. A
+                # Brave win still needs the standard LLM call below; a
+                # native win is a finished answer.
+                context_info = ""
+                answer = None
+
+                race: dict[asyncio.Task, str] = {}
+                if brave_key:
+                    logger.info("Racing Brave Search...")
+                    race[asyncio.create_task(_brave_search())] = "brave"
+                if "gemini" in model.lower():
+                    if genai is None:
+                        logger.warning("google-genai not installed. Skipping native search.")
+                    else:
+                        logger.info("Racing Gemini Native Search (via google.genai)...")
+                        race[asyncio.create_task(_native_search())] = "native"
+
+                pending = set(race)
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + 9.0
+                while pending and answer is None and not context_info:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    done, pending = await asyncio.wait(
+                        pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        try:
+                            result = task.result()
+                        except Exception as e:
+                            logger.error(f"{race[task].capitalize()} search failed: {e}")
+                            continue
+                        if not result:
+                            continue
+                        if race[task] == "brave":
+                            context_info = result
+                        else:
+                            answer = result
+                for task in pending:
+                    task.cancel()
 
-                        answer = await asyncio.to_thread(_native_generate)
-                        logger.info(f"Native answer: {answer[:50]}...")
-                        
-                    except ImportError:
-                         logger.warning("google-genai not installed. Skipping native search.")
-                    except Exception as e:
-                         logger.error(f"Native search failed: {e}")
-                
                 # If answer not obtained via native search, use standard LLM (no tools to avoid errors)
                 if not answer:
                     # Construct Prompt
@@ -574,7 +795,7 @@ class TelegramChannel(BaseChannel):
                     )
                     answer = response.content if hasattr(response, "content") else str(response)
 
-                logger.info(f"LLM final answer: {str(answer)[:100]}...")
+                logger.opt(lazy=True).info("LLM final answer: {a}...", a=lambda: str(answer)[:100])
                 
                 if not answer or "Error calling LLM" in answer:
                      answer = "⚠️ LLM Error. Try again."
@@ -589,7 +810,7 @@ class TelegramChannel(BaseChannel):
                 logger.error(f"Inline LLM error: {llm_error}")
                 answer = f"🐛 Error: {str(llm_error)[:50]}"
             
-            logger.info(f"Preparing inline result with answer: {answer[:50]}...")
+            logger.opt(lazy=True).info("Preparing inline result with answer: {a}...", a=lambda: answer[:50])
             results = [
                 InlineQueryResultArticle(
                     id=f"ans_{query_hash}",
@@ -622,7 +843,12 @@ class TelegramChannel(BaseChannel):
         message = update.message
         user = update.effective_user
         chat_id = message.chat_id
-        
+
+        # Stringify the hot IDs once; the state check, the allow checks and
+        # the bus dispatch below all want the same representations
+        user_id_str = str(user.id)
+        chat_id_str = str(chat_id)
+
         # Log incoming message details
         chat_type = message.chat.type
         
@@ -637,16 +863,25 @@ class TelegramChannel(BaseChannel):
             if is_auto_forward:
                 # Real channel post auto-forwarded to discussion
                 is_channel_post = True
-                logger.info(f"Received REAL CHANNEL POST (auto-forward) in chat_id={chat_id}, from_channel={message.sender_chat.title or message.sender_chat.id}")
+                logger.opt(lazy=True).info(
+                    "Received REAL CHANNEL POST (auto-forward) in chat_id={c}, from_channel={f}",
+                    c=lambda: chat_id, f=lambda: message.sender_chat.title or message.sender_chat.id,
+                )
             else:
                 # User writing from channel identity in chat - treat as regular message
                 is_channel_post = False
-                logger.info(f"Received message FROM CHANNEL IDENTITY in chat_id={chat_id}, channel={message.sender_chat.title or message.sender_chat.id}")
+                logger.opt(lazy=True).info(
+                    "Received message FROM CHANNEL IDENTITY in chat_id={c}, channel={f}",
+                    c=lambda: chat_id, f=lambda: message.sender_chat.title or message.sender_chat.id,
+                )
         else:
-            logger.info(f"Received message in chat_type={chat_type}, chat_id={chat_id}, from={user.username or user.id}")
+            logger.opt(lazy=True).info(
+                "Received message in chat_type={t}, chat_id={c}, from={u}",
+                t=lambda: chat_type, c=lambda: chat_id, u=lambda: user.username or user.id,
+            )
         
         # Use stable numeric ID, but keep username for allowlist compatibility
-        sender_id = str(user.id)
+        sender_id = user_id_str
         if user.username:
             sender_id = f"{sender_id}|{user.username}"
         
@@ -661,30 +896,35 @@ class TelegramChannel(BaseChannel):
                 logger.debug("Message is a reply to bot - skipping state check")
 
         # Check for history upload state (but skip if replying to bot)
-        user_id_str = str(user.id)
         if not is_reply_to_bot and self._user_states.get(user_id_str) == "waiting_for_history":
             if message.document:
                 try:
                     file = await self._app.bot.get_file(message.document.file_id)
                     
                     # Save to workspace/data/history.json
-                    from pathlib import Path
                     data_dir = Path.home() / ".nanobot" / "data"
                     data_dir.mkdir(parents=True, exist_ok=True)
                     file_path = data_dir / "history.json"
                     
-                    await file.download_to_drive(str(file_path))
-                    
+                    # Ack the user while the download runs: both are
+                    # network round trips, so overlapping them hides the
+                    # ack latency entirely
+                    ack_task = asyncio.create_task(
+                        message.reply_text("✅ History file received. Processing...")
+                    )
+                    try:
+                        await self._download_file(file, file_path)
+                    finally:
+                        await ack_task
+
                     # Reset state
                     del self._user_states[user_id_str]
-                    
-                    # Notify user
-                    await message.reply_text("✅ History file received. Processing...")
-                    
+
+
                     # Trigger agent ingestion (skip allow check for system events)
                     await self._handle_message(
                         sender_id=sender_id,
-                        chat_id=str(chat_id),
+                        chat_id=chat_id_str,
                         content=f"SYSTEM: History file uploaded to {file_path}. Please use the 'ingest_history' tool to process it and update my persona.",
                         media=[],
                         metadata={"type": "system_event"},
@@ -702,7 +942,10 @@ class TelegramChannel(BaseChannel):
                 del self._user_states[user_id_str]
                 # Continue to process the message below
         
-        # Build content from text and/or media
+        # Build content from text and/or media. These locals escape into
+        # the InboundMessage published on the bus and live until the agent
+        # finishes with them, so they must be fresh allocations — pooling/
+        # reusing them across messages would alias in-flight messages.
         content_parts = []
         media_paths = []
         
@@ -732,59 +975,69 @@ class TelegramChannel(BaseChannel):
         # Download media if present
         if media_file and self._app:
             try:
-                file = await self._app.bot.get_file(media_file.file_id)
-                ext = self._get_extension(media_type, getattr(media_file, 'mime_type', None))
-                
-                # Save to workspace/media/
-                from pathlib import Path
-                media_dir = Path.home() / ".nanobot" / "media"
-                media_dir.mkdir(parents=True, exist_ok=True)
-                
-                file_path = media_dir / f"{media_file.file_id[:16]}{ext}"
-                await file.download_to_drive(str(file_path))
-                
+                ext = _get_extension(media_type, getattr(media_file, 'mime_type', None))
+
+                # Save to workspace/media/ (directory prepared in __init__)
+                # under a hash of the full file_id: deterministic across
+                # restarts and collision-safe, unlike a raw 16-char prefix
+                key = hashlib.blake2b(media_file.file_id.encode(), digest_size=12).hexdigest()
+                file_path = self._media_dir / f"{key}{ext}"
+
+                if file_path.exists():
+                    # Same media seen before (forwards, re-sends): skip the
+                    # get_file round trip and the download entirely
+                    logger.debug(f"Media cache hit for {media_type}: {file_path}")
+                else:
+                    file = await self._app.bot.get_file(media_file.file_id)
+                    await self._download_file(file, file_path)
+                    logger.debug(f"Downloaded {media_type} to {file_path}")
+
                 media_paths.append(str(file_path))
                 content_parts.append(f"[{media_type}: {file_path}]")
-                logger.debug(f"Downloaded {media_type} to {file_path}")
             except Exception as e:
                 logger.error(f"Failed to download media: {e}")
                 content_parts.append(f"[{media_type}: download failed]")
         
-        content = "\n".join(content_parts) if content_parts else "[empty message]"
+        # Nearly every message has one or two parts (text+caption or
+        # text+media tag); branch on those before paying for str.join
+        if not content_parts:
+            content = "[empty message]"
+        elif len(content_parts) == 1:
+            content = content_parts[0]
+        elif len(content_parts) == 2:
+            content = content_parts[0] + "\n" + content_parts[1]
+        else:
+            content = "\n".join(content_parts)
         
-        logger.debug(f"Telegram message from {sender_id}: {content[:50]}...")
+        logger.opt(lazy=True).debug(
+            "Telegram message from {s}: {p}...",
+            s=lambda: sender_id, p=lambda: content[:50],
+        )
         
         # In group chats, allow everyone. In private chats, check allowFrom.
         is_group = message.chat.type in ("group", "supergroup")
         
         # Whitelist for group/channel chats: only respond in allowed chat IDs
-        allow_chats = getattr(self.config, "allow_chats", []) or []
-        if allow_chats and (is_group or is_channel_post):
-            chat_id_str = str(chat_id)
+        if self._allow_chats and (is_group or is_channel_post):
             try:
                 chat_id_abs = str(abs(int(chat_id)))
             except (ValueError, TypeError):
                 chat_id_abs = chat_id_str
-            if chat_id_str not in allow_chats and chat_id_abs not in allow_chats:
+            if chat_id_str not in self._allow_chats and chat_id_abs not in self._allow_chats:
                 logger.info(f"Ignoring message from non-whitelisted chat: {chat_id} (add to allow_chats in config)")
                 return
         
+        # Check if this is the admin (owner) - ID from allowFrom. Resolved
+        # exactly once: the group-trigger block and the metadata below both
+        # want the same answer (channel posts can extend it via sender_chat
+        # further down)
+        is_admin = bool(self._allow_set) and user_id_str in self._allow_set
+
         # In group chats, check if bot should respond based on triggers
         if is_group:
             # Filter out meaningless replies (emoji-only, too short, etc.)
-            # Remove emojis and whitespace to check if there's actual text
-            import re
-            text_only = re.sub(r'[^\w\s]', '', content)  # Remove punctuation/emoji
-            text_only = text_only.strip()
-            
-            is_meaningful = len(text_only) >= 3  # At least 3 characters of text
-            
-            # Check if sender is admin
-            is_admin = False
-            allow_list = getattr(self.config, "allow_from", [])
-            if allow_list and str(user.id) in allow_list:
-                is_admin = True
-            
+            is_meaningful = _is_meaningful(content)  # At least 3 characters of text
+
             # Handle replies to bot
             if is_reply_to_bot:
                 if not is_meaningful:
@@ -797,16 +1050,15 @@ class TelegramChannel(BaseChannel):
             elif is_channel_post:
                 logger.info("Responding to REAL CHANNEL POST (auto-forward) - providing feedback")
             else:
-                # Check for @bot mention in entities
-                has_mention = False
-                if message.entities:
-                    for entity in message.entities:
-                        if entity.type == "mention" and message.text:
-                            mention_text = message.text[entity.offset:entity.offset + entity.length]
-                            if "cloptbot_bot" in mention_text.lower():
-                                has_mention = True
-                                break
-                
+                # Check for @bot mention: entities only tell us a mention
+                # exists, so one lowercase + substring scan replaces the
+                # per-entity slice-and-lower loop
+                has_mention = bool(
+                    message.entities
+                    and message.text
+                    and self._bot_mention in message.text.lower()
+                )
+
                 # Note: is_reply_to_bot already handled above
                 # Check other triggers
                 should_respond, reason = self._should_respond_in_group(content, has_mention)
@@ -817,28 +1069,21 @@ class TelegramChannel(BaseChannel):
                 
                 logger.info(f"Responding to group message: {reason}")
         
-        # Check if this is the admin (owner) - ID from allowFrom
-        is_admin = False
-        allow_list = getattr(self.config, "allow_from", [])
-        
-        # For channel posts: check if sender_chat.id matches allowFrom OR if user.id matches
-        # (Channel posts come from sender_chat, not from user directly)
+        # For channel posts: also check if sender_chat.id matches allowFrom
+        # (Channel posts come from sender_chat, not from user directly;
+        # user.id was already checked above)
         if is_channel_post and message.sender_chat:
             sender_chat_id = str(message.sender_chat.id)
             logger.info(f"Channel post detected: sender_chat.id={sender_chat_id}, user.id={user.id}")
-            
+
             # Check if the channel itself is in allowFrom (could be positive or negative ID)
             # Try both the raw ID and absolute value
-            if allow_list and (sender_chat_id in allow_list or str(abs(message.sender_chat.id)) in allow_list):
+            if self._allow_set and (sender_chat_id in self._allow_set or str(abs(message.sender_chat.id)) in self._allow_set):
                 is_admin = True
                 logger.info(f"✅ Channel post from ALLOWED channel: {sender_chat_id}")
             else:
-                logger.warning(f"❌ Channel post from UNALLOWED channel: {sender_chat_id} (not in {allow_list})")
-        
-        # Also check user.id (for regular messages and private chats)
-        if allow_list and str(user.id) in allow_list:
-            is_admin = True
-        
+                logger.warning(f"❌ Channel post from UNALLOWED channel: {sender_chat_id} (not in {sorted(self._allow_set)})")
+
         # Build metadata
         metadata = {
             "message_id": message.message_id,
@@ -852,30 +1097,40 @@ class TelegramChannel(BaseChannel):
         
         # Add channel post metadata
         if is_channel_post:
+            # Format the post date once; both the metadata and the history
+            # entry want the same ISO string
+            msg_date_iso = message.date.isoformat() if message.date else "Unknown"
             metadata["is_channel_post"] = True
             metadata["channel_title"] = message.sender_chat.title if message.sender_chat else "Unknown"
             metadata["reply_to"] = message.message_id  # Reply to the post
-            
-            # Save channel post to chat-specific history for context
-            await self._save_channel_post(
+            metadata["date"] = msg_date_iso
+
+            # Save channel post to chat-specific history for context.
+            # Fire-and-forget: the reaction and agent dispatch below don't
+            # depend on the save, so don't hold them behind disk I/O
+            save_task = asyncio.create_task(self._save_channel_post(
                 post_id=message.message_id,
                 content=content,
-                date=message.date.isoformat() if message.date else "Unknown",
+                date=msg_date_iso,
                 from_user=metadata["channel_title"],
                 chat_id=message.chat.id
-            )
+            ))
+            self._pending_saves.add(save_task)
+            save_task.add_done_callback(self._pending_saves.discard)
         
-        # React with 👀 to show we're processing
-        await self.react(chat_id, message.message_id, "👀")
-        
-        # Forward to the message bus
-        await self._handle_message(
-            sender_id=sender_id,
-            chat_id=str(chat_id),
-            content=content,
-            media=media_paths,
-            metadata=metadata,
-            skip_allow_check=is_group  # Skip allowFrom check in groups
+        # React with 👀 to show we're processing, concurrently with the
+        # bus dispatch: the reaction is fire-and-forget UX and should not
+        # hold the agent pipeline behind a Telegram round trip
+        await asyncio.gather(
+            self.react(chat_id, message.message_id, "👀"),
+            self._handle_message(
+                sender_id=sender_id,
+                chat_id=chat_id_str,
+                content=content,
+                media=media_paths,
+                metadata=metadata,
+                skip_allow_check=is_group  # Skip allowFrom check in groups
+            ),
         )
     
     async def _on_channel_post(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -919,16 +1174,3 @@ class TelegramChannel(BaseChannel):
             },
             skip_allow_check=True  # Always allow channel posts
         )
-
-    def _get_extension(self, media_type: str, mime_type: str | None) -> str:
-        """Get file extension based on media type."""
-        if mime_type:
-            ext_map = {
-                "image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif",
-                "audio/ogg": ".ogg", "audio/mpeg": ".mp3", "audio/mp4": ".m4a",
-            }
-            if mime_type in ext_map:
-                return ext_map[mime_type]
-        
-        type_map = {"image": ".jpg", "voice": ".ogg", "audio": ".mp3", "file": ""}
-        return type_map.get(media_type, "")
@@ -1,7 +1,6 @@
 """Cron service for scheduling agent tasks."""
 
 import asyncio
-import json
 import time
 import uuid
 from pathlib import Path
@@ -10,6 +9,7 @@ from typing import Any, Callable, Coroutine
 from loguru import logger
 
 from nanobot.cron.types import CronJob, CronJobState, CronPayload, CronSchedule, CronStore
+from nanobot.utils.jsonio import json_dumps, json_loads
 
 
 def _now_ms() -> int:
@@ -52,97 +52,135 @@ class CronService:
         self._store: CronStore | None = None
         self._timer_task: asyncio.Task | None = None
         self._running = False
-    
+        # True when the on-disk JSONL file matches self._store, so add_job
+        # can append a single line instead of rewriting everything
+        self._store_synced = False
+
+    @staticmethod
+    def _job_to_dict(j: CronJob) -> dict[str, Any]:
+        """Serialize a job into its on-disk dict form."""
+        return {
+            "id": j.id,
+            "name": j.name,
+            "enabled": j.enabled,
+            "schedule": {
+                "kind": j.schedule.kind,
+                "atMs": j.schedule.at_ms,
+                "everyMs": j.schedule.every_ms,
+                "expr": j.schedule.expr,
+                "tz": j.schedule.tz,
+            },
+            "payload": {
+                "kind": j.payload.kind,
+                "message": j.payload.message,
+                "deliver": j.payload.deliver,
+                "channel": j.payload.channel,
+                "to": j.payload.to,
+            },
+            "state": {
+                "nextRunAtMs": j.state.next_run_at_ms,
+                "lastRunAtMs": j.state.last_run_at_ms,
+                "lastStatus": j.state.last_status,
+                "lastError": j.state.last_error,
+            },
+            "createdAtMs": j.created_at_ms,
+            "updatedAtMs": j.updated_at_ms,
+            "deleteAfterRun": j.delete_after_run,
+        }
+
+    @staticmethod
+    def _job_from_dict(j: dict[str, Any]) -> CronJob:
+        """Deserialize a job from its on-disk dict form."""
+        return CronJob(
+            id=j["id"],
+            name=j["name"],
+            enabled=j.get("enabled", True),
+            schedule=CronSchedule(
+                kind=j["schedule"]["kind"],
+                at_ms=j["schedule"].get("atMs"),
+                every_ms=j["schedule"].get("everyMs"),
+                expr=j["schedule"].get("expr"),
+                tz=j["schedule"].get("tz"),
+            ),
+            payload=CronPayload(
+                kind=j["payload"].get("kind", "agent_turn"),
+                message=j["payload"].get("message", ""),
+                deliver=j["payload"].get("deliver", False),
+                channel=j["payload"].get("channel"),
+                to=j["payload"].get("to"),
+            ),
+            state=CronJobState(
+                next_run_at_ms=j.get("state", {}).get("nextRunAtMs"),
+                last_run_at_ms=j.get("state", {}).get("lastRunAtMs"),
+                last_status=j.get("state", {}).get("lastStatus"),
+                last_error=j.get("state", {}).get("lastError"),
+            ),
+            created_at_ms=j.get("createdAtMs", 0),
+            updated_at_ms=j.get("updatedAtMs", 0),
+            delete_after_run=j.get("deleteAfterRun", False),
+        )
+
     def _load_store(self) -> CronStore:
-        """Load jobs from disk."""
+        """Load jobs from disk (JSONL; legacy single-JSON files still load)."""
         if self._store:
             return self._store
-        
+
         if self.store_path.exists():
             try:
-                data = json.loads(self.store_path.read_text())
+                text = self.store_path.read_text()
+                first_line = text.split("\n", 1)[0].strip()
+                try:
+                    meta = json_loads(first_line) if first_line else None
+                except Exception:
+                    meta = None  # pretty-printed legacy JSON spans lines
                 jobs = []
-                for j in data.get("jobs", []):
-                    jobs.append(CronJob(
-                        id=j["id"],
-                        name=j["name"],
-                        enabled=j.get("enabled", True),
-                        schedule=CronSchedule(
-                            kind=j["schedule"]["kind"],
-                            at_ms=j["schedule"].get("atMs"),
-                            every_ms=j["schedule"].get("everyMs"),
-                            expr=j["schedule"].get("expr"),
-                            tz=j["schedule"].get("tz"),
-                        ),
-                        payload=CronPayload(
-                            kind=j["payload"].get("kind", "agent_turn"),
-                            message=j["payload"].get("message", ""),
-                            deliver=j["payload"].get("deliver", False),
-                            channel=j["payload"].get("channel"),
-                            to=j["payload"].get("to"),
-                        ),
-                        state=CronJobState(
-                            next_run_at_ms=j.get("state", {}).get("nextRunAtMs"),
-                            last_run_at_ms=j.get("state", {}).get("lastRunAtMs"),
-                            last_status=j.get("state", {}).get("lastStatus"),
-                            last_error=j.get("state", {}).get("lastError"),
-                        ),
-                        created_at_ms=j.get("createdAtMs", 0),
-                        updated_at_ms=j.get("updatedAtMs", 0),
-                        delete_after_run=j.get("deleteAfterRun", False),
-                    ))
+                if isinstance(meta, dict) and meta.get("_type") == "metadata":
+                    # JSONL: metadata line followed by one job per line
+                    for line in text.splitlines()[1:]:
+                        line = line.strip()
+                        if line:
+                            jobs.append(self._job_from_dict(json_loads(line)))
+                    self._store_synced = True
+                else:
+                    # Legacy format: one JSON document with a "jobs" array
+                    data = json_loads(text)
+                    for j in data.get("jobs", []):
+                        jobs.append(self._job_from_dict(j))
                 self._store = CronStore(jobs=jobs)
             except Exception as e:
                 logger.warning(f"Failed to load cron store: {e}")
                 self._store = CronStore()
         else:
             self._store = CronStore()
-        
+
         return self._store
-    
+
     def _save_store(self) -> None:
-        """Save jobs to disk."""
+        """
+        Save jobs to disk.
+
+        The store is JSONL: a metadata line followed by one job per line.
+        This full rewrite runs when job state changes (runs, removals,
+        toggles); plain add_job appends a single line instead, so creating
+        a reminder stays O(1) in the number of existing jobs.
+        """
         if not self._store:
             return
-        
+
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        data = {
-            "version": self._store.version,
-            "jobs": [
-                {
-                    "id": j.id,
-                    "name": j.name,
-                    "enabled": j.enabled,
-                    "schedule": {
-                        "kind": j.schedule.kind,
-                        "atMs": j.schedule.at_ms,
-                        "everyMs": j.schedule.every_ms,
-                        "expr": j.schedule.expr,
-                        "tz": j.schedule.tz,
-                    },
-                    "payload": {
-                        "kind": j.payload.kind,
-                        "message": j.payload.message,
-                        "deliver": j.payload.deliver,
-                        "channel": j.payload.channel,
-                        "to": j.payload.to,
-                    },
-                    "state": {
-                        "nextRunAtMs": j.state.next_run_at_ms,
-                        "lastRunAtMs": j.state.last_run_at_ms,
-                        "lastStatus": j.state.last_status,
-                        "lastError": j.state.last_error,
-                    },
-                    "createdAtMs": j.created_at_ms,
-                    "updatedAtMs": j.updated_at_ms,
-                    "deleteAfterRun": j.delete_after_run,
-                }
-                for j in self._store.jobs
-            ]
-        }
-        
-        self.store_path.write_text(json.dumps(data, indent=2))
+
+        lines = [json_dumps({"_type": "metadata", "version": self._store.version}) + "\n"]
+        lines.extend(json_dumps(self._job_to_dict(j)) + "\n" for j in self._store.jobs)
+        self.store_path.write_text("".join(lines))
+        self._store_synced = True
+
+    def _append_job(self, job: CronJob) -> None:
+        """Append a single job line to the store, or fall back to a full save."""
+        if not self._store_synced or not self.store_path.exists():
+            self._save_store()
+            return
+        with open(self.store_path, "a") as f:
+            f.write(json_dumps(self._job_to_dict(job)) + "\n")
     
     async def start(self) -> None:
         """Start the cron service."""
@@ -287,7 +325,7 @@ class CronService:
         )
         
         store.jobs.append(job)
-        self._save_store()
+        self._append_job(job)
         self._arm_timer()
         
         logger.info(f"Cron: added job '{name}' ({job.id})")
@@ -1,10 +1,14 @@
 """LiteLLM provider implementation for multi-provider support."""
 
+import asyncio
+import json
 import os
+import time
 from typing import Any
 
 import litellm
 from litellm import acompletion
+from loguru import logger
 
 from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
 
@@ -109,6 +113,9 @@ class LiteLLMProvider(LLMProvider):
             elif not model.startswith("gemini/"):
                 model = f"gemini/{model}"
         
+        # Mark the stable prefix for provider-side prompt caching
+        messages = self._apply_cache_control(messages, model)
+
         kwargs: dict[str, Any] = {
             "model": model,
             "messages": messages,
@@ -121,6 +128,11 @@ class LiteLLMProvider(LLMProvider):
             kwargs["api_base"] = self.api_base
         
         if tools:
+            # Tool schemas sit at the very front of the Anthropic prompt;
+            # marking the last one extends the cached prefix over all of them
+            if tools and self._supports_cache_control(model):
+                tools = list(tools)
+                tools[-1] = {**tools[-1], "cache_control": {"type": "ephemeral"}}
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
         
@@ -130,9 +142,6 @@ class LiteLLMProvider(LLMProvider):
         # Ensure at least 1 attempt
         attempts = max(1, max_retries + 1)
         
-        from loguru import logger
-        import time
-        
         # Log request details
         msg_count = len(messages)
         total_chars = sum(len(str(m.get("content", ""))) for m in messages)
@@ -169,11 +178,59 @@ class LiteLLMProvider(LLMProvider):
                     )
                 
                 # Wait before retry with exponential backoff
-                import asyncio
                 wait_time = retry_delay * (2 ** attempt)
                 logger.warning(f"Retrying in {wait_time}s...")
                 await asyncio.sleep(wait_time)
     
+    @staticmethod
+    def _supports_cache_control(model: str) -> bool:
+        """Check if the model supports Anthropic-style cache_control markers."""
+        model_lower = model.lower()
+        return "claude" in model_lower or "anthropic" in model_lower
+
+    def _apply_cache_control(
+        self, messages: list[dict[str, Any]], model: str
+    ) -> list[dict[str, Any]]:
+        """
+        Add cache_control breakpoints so the provider reuses its KV-cache
+        for the stable prefix (system prompt + conversation history).
+
+        Marks the system prompt, the last history message before the current
+        turn, and the final message itself. The last breakpoint is what lets
+        the agent loop re-send the growing conversation each tool iteration
+        while the provider replays everything up to the newest message from
+        its cache instead of reprocessing it. Returns a shallow copy; the
+        caller's list is not mutated. No-op for providers without prompt
+        caching.
+        """
+        if not self._supports_cache_control(model):
+            return messages
+
+        def mark(msg: dict[str, Any]) -> dict[str, Any]:
+            content = msg.get("content")
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+            elif isinstance(content, list):
+                content = [dict(part) for part in content]
+            else:
+                return msg
+            if not content:
+                return msg
+            content[-1] = {**content[-1], "cache_control": {"type": "ephemeral"}}
+            return {**msg, "content": content}
+
+        result = list(messages)
+        if result and result[0].get("role") == "system":
+            result[0] = mark(result[0])
+        # Breakpoint at the end of history (everything before the current turn)
+        if len(result) > 2:
+            result[-2] = mark(result[-2])
+        # Breakpoint on the newest message: the next loop iteration extends
+        # this exact prefix, so it's a pure cache read
+        if len(result) > 1:
+            result[-1] = mark(result[-1])
+        return result
+
     def _parse_response(self, response: Any) -> LLMResponse:
         """Parse LiteLLM response into our standard format."""
         choice = response.choices[0]
@@ -185,7 +242,6 @@ class LiteLLMProvider(LLMProvider):
                 # Parse arguments from JSON string if needed
                 args = tc.function.arguments
                 if isinstance(args, str):
-                    import json
                     try:
                         args = json.loads(args)
                     except json.JSONDecodeError:
@@ -1,6 +1,5 @@
 """Session management for conversation history."""
 
-import json
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -9,6 +8,7 @@ from typing import Any
 from loguru import logger
 
 from nanobot.utils.helpers import ensure_dir, safe_filename
+from nanobot.utils.jsonio import json_dumps, json_loads
 
 
 @dataclass
@@ -24,6 +24,8 @@ class Session:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # How many of `messages` are already on disk (see SessionManager.save)
+    _persisted_count: int = field(default=0, init=False, repr=False, compare=False)
     
     def add_message(self, role: str, content: str, **kwargs: Any) -> None:
         """Add a message to the session."""
@@ -49,27 +51,32 @@ class Session:
         """
         # Get recent messages
         recent = self.messages[-max_messages:] if len(self.messages) > max_messages else self.messages
-        
-        # Convert to LLM format (just role and content)
-        result = [{"role": m["role"], "content": m["content"]} for m in recent]
-        
-        # Trim by character limit (from oldest to newest)
-        total_chars = sum(len(m["content"]) for m in result)
-        while total_chars > max_chars and len(result) > 2:
-            removed = result.pop(0)
-            total_chars -= len(removed["content"])
-        
-        return result
+
+        # Walk backwards to find the char-bounded window (always keeping the
+        # last two messages), then build the LLM-format list exactly once —
+        # no full conversion followed by O(n) pops from the front.
+        total_chars = 0
+        start = len(recent)
+        for i in range(len(recent) - 1, -1, -1):
+            total_chars += len(recent[i]["content"])
+            if total_chars > max_chars and len(recent) - i > 2:
+                break
+            start = i
+
+        return [{"role": m["role"], "content": m["content"]} for m in recent[start:]]
     
     def clear(self) -> None:
         """Clear all messages in the session."""
         self.messages = []
+        # Nothing on disk matches anymore; the next save must rewrite
+        self._persisted_count = 0
         self.updated_at = datetime.now()
-    
+
     def clear_history(self) -> int:
         """Clear all messages and return count of cleared messages."""
         count = len(self.messages)
         self.messages = []
+        self._persisted_count = 0
         self.updated_at = datetime.now()
         return count
 
@@ -136,7 +143,7 @@ class SessionManager:
                     if not line:
                         continue
                     
-                    data = json.loads(line)
+                    data = json_loads(line)
                     
                     if data.get("_type") == "metadata":
                         metadata = data.get("metadata", {})
@@ -144,34 +151,53 @@ class SessionManager:
                     else:
                         messages.append(data)
             
-            return Session(
+            session = Session(
                 key=key,
                 messages=messages,
                 created_at=created_at or datetime.now(),
                 metadata=metadata
             )
+            session._persisted_count = len(messages)
+            return session
         except Exception as e:
             logger.warning(f"Failed to load session {key}: {e}")
             return None
     
     def save(self, session: Session) -> None:
-        """Save a session to disk."""
+        """
+        Save a session to disk.
+
+        The JSONL file is append-only in the common case: only messages added
+        since the last save are serialized and written in a single batched
+        write. A full rewrite happens only when the file doesn't exist yet or
+        the session was cleared (fewer messages than already persisted).
+        """
         path = self._get_session_path(session.key)
-        
-        with open(path, "w") as f:
-            # Write metadata first
+
+        can_append = (
+            0 < session._persisted_count <= len(session.messages)
+            and path.exists()
+        )
+
+        if can_append:
+            new_messages = session.messages[session._persisted_count:]
+            if new_messages:
+                payload = "".join(json_dumps(m) + "\n" for m in new_messages)
+                with open(path, "a") as f:
+                    f.write(payload)
+        else:
             metadata_line = {
                 "_type": "metadata",
                 "created_at": session.created_at.isoformat(),
                 "updated_at": session.updated_at.isoformat(),
                 "metadata": session.metadata
             }
-            f.write(json.dumps(metadata_line) + "\n")
-            
-            # Write messages
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
-        
+            lines = [json_dumps(metadata_line) + "\n"]
+            lines.extend(json_dumps(m) + "\n" for m in session.messages)
+            with open(path, "w") as f:
+                f.write("".join(lines))
+
+        session._persisted_count = len(session.messages)
         self._cache[session.key] = session
     
     def delete(self, key: str) -> bool:
@@ -209,7 +235,7 @@ class SessionManager:
                 with open(path) as f:
                     first_line = f.readline().strip()
                     if first_line:
-                        data = json.loads(first_line)
+                        data = json_loads(first_line)
                         if data.get("_type") == "metadata":
                             sessions.append({
                                 "key": path.stem.replace("_", ":"),
@@ -0,0 +1,30 @@
+"""JSON helpers for hot paths: orjson when available, stdlib fallback."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a compact JSON string (orjson-backed)."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    def json_loads(data: str | bytes) -> Any:
+        """Parse a JSON string or bytes (orjson-backed)."""
+        return orjson.loads(data)
+
+else:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a compact JSON string (stdlib fallback)."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def json_loads(data: str | bytes) -> Any:
+        """Parse a JSON string or bytes (stdlib fallback)."""
+        return json.loads(data)
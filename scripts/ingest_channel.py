@@ -1,9 +1,10 @@
 import asyncio
 import os
-import json
 from pathlib import Path
 from telethon import TelegramClient
 
+from nanobot.utils.jsonio import json_dumps
+
 # You need to get these from https://my.telegram.org/
 # Or set them in environment variables
 API_ID = os.getenv("TELEGRAM_API_ID")
@@ -21,29 +22,62 @@ async def main():
     async with TelegramClient('nanobot_ingest', API_ID, API_HASH) as client:
         print(f"Scraping {limit} messages from {channel_username}...")
         
-        messages = []
-        async for message in client.iter_messages(channel_username, limit=limit):
-            if message.text:
-                messages.append({
-                    "id": message.id,
-                    "date": message.date.isoformat(),
-                    "text": message.text,
-                    "views": message.views,
-                    "forwards": message.forwards
-                })
-        
-        # Save to file
+        # Stream each message to disk as it arrives instead of building the
+        # whole list (and its pretty-printed dump) in memory first; only
+        # the texts are kept around for the persona preview below
         output_file = Path("channel_history.json")
-        output_file.write_text(json.dumps(messages, indent=2, ensure_ascii=False), encoding="utf-8")
-        print(f"Saved {len(messages)} messages to {output_file}")
-        
+        count = 0
+        preview_parts = []
+        preview_len = 0
+
+        # Fetch and serialize run as separate coroutines joined by a
+        # bounded queue, so serializing/writing one batch overlaps the
+        # network wait for the next (wait_time=0 lets Telethon page as
+        # fast as the API allows)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=512)
+
+        async def fetch() -> None:
+            async for message in client.iter_messages(channel_username, limit=limit, wait_time=0):
+                if message.text:
+                    await queue.put(message)
+            await queue.put(None)
+
+        with output_file.open("w", encoding="utf-8") as f:
+            f.write("[\n")
+
+            async def write() -> None:
+                nonlocal count, preview_len
+                while True:
+                    message = await queue.get()
+                    if message is None:
+                        return
+                    if count:
+                        f.write(",\n")
+                    f.write(json_dumps({
+                        "id": message.id,
+                        "date": message.date.isoformat(),
+                        "text": message.text,
+                        "views": message.views,
+                        "forwards": message.forwards
+                    }))
+                    count += 1
+                    # The persona draft only shows the first 500 chars, so
+                    # stop collecting text once that much is buffered
+                    if preview_len < 500:
+                        preview_parts.append(message.text)
+                        preview_len += len(message.text) + 2
+
+            await asyncio.gather(fetch(), write())
+            f.write("\n]\n")
+        print(f"Saved {count} messages to {output_file}")
+
         print("\nGenerating PERSONA.md draft...")
-        
-        full_text = "\n\n".join([m["text"] for m in messages])
+
+        full_text = "\n\n".join(preview_parts)
         
         persona_draft = f"""# Learned Persona
         
-Based on {len(messages)} messages from {channel_username}.
+Based on {count} messages from {channel_username}.
 
 ## Writing Style
 - Tone: [Analyze based on content]